@@ -10,7 +10,7 @@ from copy import deepcopy
 from dataclasses import _FIELD, _DataclassParams  # type: ignore
 from inspect import _empty, signature
 from itertools import chain
-from types import UnionType, new_class
+from types import FunctionType, UnionType, new_class
 from typing import Any, Callable, ClassVar, Generic, Literal, Type, TypeVar, Union, cast, dataclass_transform
 
 import rich.repr
@@ -31,7 +31,7 @@ from cwtch.config import (
 from cwtch.core import _CACHE, _DEFAULT, _MISSING, UNSET, Unset, _Missing
 from cwtch.core import asdict as _asdict
 from cwtch.core import dumps_json as _dumps_json
-from cwtch.core import get_validator, validate_value, validate_value_using_validator
+from cwtch.core import get_validator, is_pass_through_type, validate_value, validate_value_using_validator
 from cwtch.errors import ValidationError
 
 
@@ -428,14 +428,17 @@ def view(
 
 
 class _ViewDesc:
-    def __init__(self, view_cls: Type):
+    def __init__(self, view_cls: Type, base_cls: Type):
         self.view_cls = view_cls
+        # fields copied from base instance, computed once instead of on every view creation
+        self.fields = frozenset(k for k in view_cls.__dataclass_fields__ if k in base_cls.__dataclass_fields__)
 
     def __get__(self, obj, owner=None):
         view_cls = self.view_cls
         if obj:
-            # TODO
-            return lambda: view_cls(**{k: v for k, v in _asdict(obj).items() if k in view_cls.__dataclass_fields__})
+            fields = self.fields
+            # asdict copies nested models and containers, so the view does not share them with the instance
+            return lambda: view_cls(**{k: v for k, v in _asdict(obj).items() if k in fields})
         return view_cls
 
 
@@ -552,13 +555,27 @@ def _instantiate_generic(tp):
 # -------------------------------------------------------------------------------------------------------------------- #
 
 
+# subscriptions already resolved by __class_getitem__, typing subscription and parameters checks are slow
+_class_getitem_cache: dict[tuple, Any] = {}
+
+
 def _make_class_getitem(__class__):
 
     def __class_getitem__(cls, *args, **kwds):
+        if not kwds:
+            try:
+                return _class_getitem_cache[(cls, args)]
+            except (KeyError, TypeError):
+                pass
         result = super().__class_getitem__(*args, **kwds)  # type: ignore
         if not hasattr(result, "__cwtch_instantiated__"):
             result = _instantiate_generic(result)
             setattr(result, "__cwtch_instantiated__", True)
+        if not kwds:
+            try:
+                _class_getitem_cache[(cls, args)] = result
+            except TypeError:
+                pass
         return result
 
     __class__.__class_getitem__ = __class_getitem__
@@ -717,6 +734,7 @@ def _create_init(
         "_env_source": env_source or _default_env_source,
         "_json_loads": json.loads,
         "_builtins_id": id,
+        "_builtins_type": type,
         "ValidationError": ValidationError,
         "JSONDecodeError": json.JSONDecodeError,
     }
@@ -731,24 +749,30 @@ def _create_init(
     body = ["__cwtch_fields_set__ = ()"]
 
     if env_prefixes is not UNSET:
+        # environment variable names are known at build time, only their values are read on init
+        env_keys = []
+        for f_name, f in fields.items():
+            if env_var := f.metadata.get("env_var", True):
+                keys = dict.fromkeys(
+                    env_var if isinstance(env_var, str) else f"{env_prefix}{f_name}".upper()
+                    for env_prefix in env_prefixes
+                )
+                if keys:
+                    env_keys.append((f_name, tuple(keys)))
+        locals["_env_keys"] = tuple(env_keys)
         body += [
-            "env_source_data = _env_source()",
-            "env_data = {}",
-            "for f_name, f in __cwtch_self__.__dataclass_fields__.items():",
-            "   if env_var := f.metadata.get('env_var', True):",
-            "       for env_prefix in _env_prefixes:",
-            "           if isinstance(env_var, str):",
-            "               key = env_var",
-            "           else:",
-            "               key = f'{env_prefix}{f_name}'.upper()",
-            "           if key in env_source_data:",
-            "               env_data[f_name] = env_value = env_source_data[key]",
-            "               if env_value[0] in ('[', '{') and env_value[-1] in (']', '}'):",
-            "                   try:",
-            "                       env_data[f_name] = _json_loads(env_value)",
-            "                   except JSONDecodeError:",
-            "                       pass",
-            "               break",
+            "__cwtch_env_source_data = _env_source()",
+            "__cwtch_env_data = {}",
+            "for __cwtch_f_name, __cwtch_keys in _env_keys:",
+            "   for __cwtch_key in __cwtch_keys:",
+            "       if __cwtch_key in __cwtch_env_source_data:",
+            "           __cwtch_env_data[__cwtch_f_name] = __cwtch_env_value = __cwtch_env_source_data[__cwtch_key]",
+            "           if __cwtch_env_value[0] in ('[', '{') and __cwtch_env_value[-1] in (']', '}'):",
+            "               try:",
+            "                   __cwtch_env_data[__cwtch_f_name] = _json_loads(__cwtch_env_value)",
+            "               except JSONDecodeError:",
+            "                   pass",
+            "           break",
         ]
 
     if fields:
@@ -805,8 +829,8 @@ def _create_init(
             if env_prefixes is not UNSET:
                 body += [
                     f"{indent}if {f_name} is _MISSING or {f_name} is _DEFAULT:",
-                    f"{indent}    if '{f_name}' in env_data:",
-                    f"{indent}        {f_name} = env_data['{f_name}']",
+                    f"{indent}    if '{f_name}' in __cwtch_env_data:",
+                    f"{indent}        {f_name} = __cwtch_env_data['{f_name}']",
                 ]
                 if field.default is not _MISSING:
                     body += [
@@ -870,11 +894,19 @@ def _create_init(
                 ]
             if field.validate or (field.validate is UNSET and validate):
                 locals[f"v_{f_name}"] = get_validator(field.type)
+                if is_pass_through_type(field.type):
+                    # exact instances are returned as is by the builtin validator
+                    validate_expr = (
+                        f"{f_name} if _builtins_type({f_name}) is t_{f_name} "
+                        f"else _validate({f_name}, t_{f_name}, v_{f_name})"
+                    )
+                else:
+                    validate_expr = f"_validate({f_name}, t_{f_name}, v_{f_name})"
                 if add_disable_validation_to_init:
                     body += [
                         f"{indent}if disable_validation is not True:",
                         f"{indent}    try:",
-                        f"{indent}        _{f_name} = _validate({f_name}, t_{f_name}, v_{f_name})",
+                        f"{indent}        _{f_name} = {validate_expr}",
                         f"{indent}    except Exception as e:",
                         f"{indent}        raise ValidationError(",
                         f"{indent}            ..., __class__, [e], path=['{f_name}'], path_value={f_name}"
@@ -885,24 +917,24 @@ def _create_init(
                 else:
                     body += [
                         f"{indent}try:",
-                        f"{indent}    _{f_name} = _validate({f_name}, t_{f_name}, v_{f_name})",
+                        f"{indent}    _{f_name} = {validate_expr}",
                         f"{indent}except Exception as e:",
                         f"{indent}    raise ValidationError(",
                         f"{indent}        ..., __class__, [e], path=['{f_name}'], path_value={f_name}",
                         f"{indent}    )",
                     ]
+                value_name = f"_{f_name}"
             else:
-                body += [
-                    f"{indent}_{f_name} = {f_name}",
-                ]
+                # not validated, the argument is stored as is
+                value_name = f_name
             if field.property:
                 body += [
-                    f"__cwtch_self__._prop_{f_name} = _{f_name}",
+                    f"__cwtch_self__._prop_{f_name} = {value_name}",
                     f"__class__.{f_name} = property(lambda self: self._prop_{f_name})",
                 ]
             else:
                 body += [
-                    f"{indent}__cwtch_self__.{f_name} = _{f_name}",
+                    f"{indent}__cwtch_self__.{f_name} = {value_name}",
                 ]
 
         body += [
@@ -926,18 +958,19 @@ def _create_init(
 
     args += ["**__extra_kwds"]
 
-    body += [
-        "if '__post_init__' in __class__.__dict__:",
-        "    try:",
-        "        __class__.__dict__['__post_init__'](__cwtch_self__)",
-        "    except ValueError as e:",
-        "        raise ValidationError(",
-        "            __cwtch_self__,",
-        "            __class__,",
-        "            [e],",
-        "            path=[f'{__class__.__name__}.__post_init__']",
-        "        )",
-    ]
+    if (post_init := cls.__dict__.get("__post_init__")) is not None:
+        locals["_post_init"] = post_init
+        body += [
+            "try:",
+            "    _post_init(__cwtch_self__)",
+            "except ValueError as e:",
+            "    raise ValidationError(",
+            "        __cwtch_self__,",
+            "        __class__,",
+            "        [e],",
+            "        path=[f'{__class__.__name__}.__post_init__']",
+            "    )",
+        ]
 
     __init__ = _create_fn(cls, "__init__", args, body, globals=globals, locals=locals)
 
@@ -1520,7 +1553,7 @@ def _build_view(
     setattr(view_cls, "cwtch_rebuild", classmethod(cwtch_rebuild))
 
     if attach or (attach is UNSET and ATTACH):
-        setattr(cls, view_name, _ViewDesc(view_cls))
+        setattr(cls, view_name, _ViewDesc(view_cls, cls))
 
     return view_cls
 
@@ -1635,6 +1668,17 @@ def resolve_types(cls, globalns=None, localns=None, *, include_extras: bool = Tr
 # -------------------------------------------------------------------------------------------------------------------- #
 
 
+def _get_args_annotations(fn: Callable) -> dict[str, Any]:
+    # plain functions keep their parameter annotations in their own __dict__,
+    # other callables (bound methods, callable instances) are inspected on every call
+    if type(fn) is not FunctionType:
+        return {k: v.annotation for k, v in signature(fn).parameters.items()}
+    if (annotations := fn.__dict__.get("__cwtch_args_annotations__")) is None:
+        annotations = {k: v.annotation for k, v in signature(fn).parameters.items()}
+        fn.__dict__["__cwtch_args_annotations__"] = annotations
+    return annotations
+
+
 def validate_args(fn: Callable, args: tuple, kwds: dict) -> tuple[tuple, dict]:
     """
     Helper to convert and validate function arguments.
@@ -1644,7 +1688,7 @@ def validate_args(fn: Callable, args: tuple, kwds: dict) -> tuple[tuple, dict]:
       kwds: function keyword arguments.
     """
 
-    annotations = {k: v.annotation for k, v in signature(fn).parameters.items()}
+    annotations = _get_args_annotations(fn)
 
     validated_args = []
     for v, (arg_name, T) in zip(args, annotations.items()):
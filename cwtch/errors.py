@@ -7,6 +7,21 @@ from cwtch.config import SHOW_INPUT_VALUE_ON_ERROR
 __all__ = ("Error", "ValidationError")
 
 
+# formatted annotations keyed by id, the annotation itself is kept alive so the id can not be reused;
+# equal annotations are not interchangeable here (int | float == Union[int, float] but reprs differ)
+_type_str_cache: dict[int, tuple[Any, str]] = {}
+
+
+def _type_str(tp) -> str:
+    if (cached := _type_str_cache.get(id(tp))) is not None:
+        return cached[1]
+    if len(_type_str_cache) >= 1024:
+        _type_str_cache.clear()
+    tp_str = f"{tp}".replace("typing.", "")
+    _type_str_cache[id(tp)] = (tp, tp_str)
+    return tp_str
+
+
 class Error(Exception):
     pass
 
@@ -43,8 +58,7 @@ class ValidationError(Error):
                     for e in self.errors
                 ]
             )
-            tp = self.type
-            tp = f"{tp}".replace("typing.", "")
+            tp = _type_str(self.type)
             path = ""
             if self.path:
                 path = f" path[ {str(self.path)[1:-1]} ]"
@@ -80,8 +94,7 @@ class ValidationError(Error):
                     for e in self.errors
                 ]
             )
-            tp = self.type
-            tp = f"{tp}".replace("typing.", "")
+            tp = _type_str(self.type)
             path = ""
             if self.path:
                 path = f" path[ {str(self.path)[1:-1]} ]"
@@ -396,12 +396,11 @@ class Strict(TypeMetadata):
         object.__setattr__(self, "type", fn(self.type))
 
     def __hash__(self):
-        return hash(f"{self.type}")
+        return hash(tuple(self.type))
 
     def before(self, value, /):
-        for tp in typing.cast(list, self.type):
-            if isinstance(value, tp) and type(value) == tp:  # noqa: E721
-                return value
+        if type(value) in typing.cast(list, self.type):
+            return value
         raise ValueError(f"invalid value for {' | '.join(map(str, typing.cast(list, self.type)))}")
 
 
@@ -229,6 +229,9 @@ class SecretStr(str):
         return self._value
 
 
+_HOSTNAME_LABEL_RE = re.compile(r"(?!-)[a-zA-Z\d-]{1,63}(?<!-)$")
+
+
 @lru_cache
 def _validate_hostname(hostname: str):
     if 1 > len(hostname) > 255:
@@ -238,7 +241,7 @@ def _validate_hostname(hostname: str):
         ip_address(hostname)
     else:
         for label in splitted:
-            if not re.match(r"(?!-)[a-zA-Z\d-]{1,63}(?<!-)$", label):
+            if not _HOSTNAME_LABEL_RE.match(label):
                 raise ValueError("invalid hostname")
 
 
@@ -332,15 +335,8 @@ class SecretUrl(str, _UrlMixIn):
         return obj
 
     def __repr__(self):
-        parsed = self._parsed
-        value = (
-            parsed._replace(
-                netloc=f"***:***@{parsed.hostname}" + (f":{parsed.port}" if parsed.port is not None else "")
-            ).geturl()
-            if parsed.scheme
-            else parsed.geturl()
-        )
-        return f"{self.__class__.__name__}({value})"
+        # the string value itself is the masked url built in __new__
+        return f"{self.__class__.__name__}({self})"
 
     def __hash__(self):
         return hash(self._value)
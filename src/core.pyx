@@ -36,7 +36,7 @@ import orjson
 
 from typing_extensions import Doc
 
-from .errors import ValidationError
+from .errors import ValidationError, _type_str
 
 
 __all__ = (
@@ -209,6 +209,8 @@ class TypeWrapper(Generic[T], metaclass=TypeWrapperMeta):
 class TypeMetadata:
     """Base class for type metadata."""
 
+    __slots__ = ()
+
     def json_schema(self) -> dict:
         return {}
 
@@ -224,15 +226,21 @@ def asdict_handler(inst, kwds):
     if (fields := getattr(inst, "__dataclass_fields__", None)) is None:
         return inst
 
+    exclude_unset: cython.bint = kwds.exclude_unset
+    exclude_none: cython.bint = kwds.exclude_none
+
     data = {}
 
     for k in fields:
         v = getattr(inst, k, None)
-        if kwds.exclude_unset and v is UNSET:
+        if exclude_unset and v is UNSET:
             continue
-        if kwds.exclude_none and v is None:
+        if exclude_none and v is None:
             continue
-        if isinstance(v, list):
+        v_type = type(v)
+        if v_type is int or v_type is str or v_type is float or v_type is bool:
+            data[k] = v
+        elif isinstance(v, list):
             data[k] = [x if isinstance(x, (int, str, float, bool)) else _asdict_handler(x, kwds) for x in v]
         elif isinstance(v, dict):
             data[k] = {
@@ -244,9 +252,9 @@ def asdict_handler(inst, kwds):
             data[k] = {x if isinstance(x, (int, str, float, bool)) else _asdict_handler(x, kwds) for x in v}
         else:
             v = _asdict_handler(v, kwds)
-            if kwds.exclude_unset and v is UNSET:
+            if exclude_unset and v is UNSET:
                 continue
-            if kwds.exclude_none and v is None:
+            if exclude_none and v is None:
                 continue
             data[k] = v
 
@@ -278,6 +286,9 @@ def asdict_root_handler(inst, kwds):
 
     kwds_ = AsDictKwds(UNSET, UNSET, kwds[2], kwds[3], kwds[4])
 
+    exclude_unset: cython.bint = kwds.exclude_unset
+    exclude_none: cython.bint = kwds.exclude_none
+
     data = {}
 
     for k in keys:
@@ -286,11 +297,15 @@ def asdict_root_handler(inst, kwds):
         if use_exc_cond and k in kwds[1]:
             continue
         v = getattr(inst, k, None)
-        if kwds.exclude_unset and v is UNSET:
+        if exclude_unset and v is UNSET:
             continue
-        if kwds.exclude_none and v is None:
+        if exclude_none and v is None:
             continue
-        if isinstance(v, list):
+        v_type = type(v)
+        if v_type is int or v_type is str or v_type is float or v_type is bool:
+            # builtin scalars are copied as is
+            data[k] = v
+        elif isinstance(v, list):
             data[k] = [x if isinstance(x, (int, str, float, bool)) else _asdict_handler(x, kwds_) for x in v]
         elif isinstance(v, dict):
             data[k] = {
@@ -303,9 +318,9 @@ def asdict_root_handler(inst, kwds):
             data[k] = {x if isinstance(x, (int, str, float, bool)) else _asdict_handler(x, kwds_) for x in v}
         else:
             v = _asdict_handler(v, kwds_)
-            if kwds.exclude_unset and v is UNSET:
+            if exclude_unset and v is UNSET:
                 continue
-            if kwds.exclude_none and v is None:
+            if exclude_none and v is None:
                 continue
             data[k] = v
 
@@ -325,6 +340,8 @@ def validate_none(value, T, /):
 
 @cython.cfunc
 def validate_bool(value, T, /):
+    if type(value) is bool:
+        return value
     if value in TRUE_MAP:
         return True
     if value in FALSE_MAP:
@@ -334,16 +351,22 @@ def validate_bool(value, T, /):
 
 @cython.cfunc
 def validate_int(value, T, /):
+    if type(value) is int:
+        return value
     return PyNumber_Long(value)
 
 
 @cython.cfunc
 def validate_float(value, T, /):
+    if type(value) is float:
+        return value
     return PyNumber_Float(value)
 
 
 @cython.cfunc
 def validate_str(value, T, /):
+    if type(value) is str:
+        return value
     if not isinstance(value, str):
         raise ValueError(f"value is not a valid {T}")
     return f"{value}"
@@ -351,6 +374,8 @@ def validate_str(value, T, /):
 
 @cython.cfunc
 def validate_bytes(value, T, /):
+    if type(value) is bytes:
+        return value
     if isinstance(value, str):
         return value.encode()
     return bytes(value)
@@ -358,7 +383,15 @@ def validate_bytes(value, T, /):
 
 @cython.cfunc
 def validate_type(value, T, /):
-    value = getattr(value, "_cwtch_o", value)
+    value_type = type(value)
+    if value_type is T:
+        return value
+    if value_type is dict:
+        if getattr(T, "__cwtch_handle_circular_refs__", None) is False:
+            # plain cwtch model built from a dict
+            return PyObject_Call(T, (), value)
+    else:
+        value = getattr(value, "_cwtch_o", value)
     if (origin := getattr(T, "__origin__", T)) == T:
         if isinstance(value, origin):
             return value
@@ -381,34 +414,66 @@ def validate_type(value, T, /):
             raise ValueError("value is not a None")
         return value
     if origin == type:
-        if type(value) != type:
+        if type(value) is not type:
             raise ValueError(f"value should be a type")
         if (args := getattr(T, "__args__", None)) is not None:
             arg = T.__args__[0]
             if getattr(arg, "__base__", None) is None or not issubclass(value, arg):
-                raise ValueError(f"invalid value for {T}".replace("typing.", ""))
+                raise ValueError(f"invalid value for {_type_str(T)}")
         return value
     return origin(value)
 
 
+# validators of the builtin types whose exact instances are returned as is, filled in by __()
+pass_through_validators = cython.declare(dict, {})
+
+
+@cython.ccall
+def is_pass_through_type(T, /) -> cython.bint:
+    # exact instances of T can skip validation, unless register_validator replaced the builtin validator
+    if type(T) is not type or (validator := pass_through_validators.get(T)) is None:
+        return False
+    return validators_map.get(T) is validator
+
+
+@cython.cfunc
+def is_homogeneous(value, T, /) -> cython.bint:
+    if not is_pass_through_type(T):
+        return False
+    for x in value:
+        if type(x) is not T:
+            return False
+    return True
+
+
+@cython.cfunc
+def is_homogeneous_dict(value: dict, T_k, T_v, /) -> cython.bint:
+    if not is_pass_through_type(T_k) or not is_pass_through_type(T_v):
+        return False
+    for k, v in value.items():
+        if type(k) is not T_k or type(v) is not T_v:
+            return False
+    return True
+
+
 @cython.cfunc
 def validate_list(value, T, /):
     if isinstance(value, list):
         if (args := getattr(T, "__args__", None)) is not None:
             try:
                 T_arg = args[0]
-                if T_arg == int:
-                    return [x if type(x) == int else PyNumber_Long(x) for x in value]
-                if T_arg == str:
+                if is_homogeneous(value, T_arg):
+                    # items already have the exact type, copy without per item checks
+                    return value[:]
+                if T_arg is int:
+                    return [x if type(x) is int else PyNumber_Long(x) for x in value]
+                if T_arg is str:
                     return [validate_str(x, str) for x in value]
-                if T_arg == float:
-                    return [x if type(x) == float else PyNumber_Float(x) for x in value]
+                if T_arg is bytes:
+                    return [validate_bytes(x, bytes) for x in value]
+                if T_arg is float:
+                    return [x if type(x) is float else PyNumber_Float(x) for x in value]
                 validator = get_validator(T_arg)
-                if validator == validate_type:
-                    origin = getattr(T_arg, "__origin__", T_arg)
-                    return [getattr(x, "_cwtch_o", x) if isinstance(x, origin) else validator(x, T_arg) for x in value]
-                if validator == validate_any:
-                    return value
                 return [validator(x, T_arg) for x in value]
             except (TypeError, ValueError, ValidationError) as e:
                 i: cython.int = 0
@@ -429,23 +494,22 @@ def validate_list(value, T, /):
         return value
 
     if not isinstance(value, (tuple, set)):
-        raise ValueError(f"invalid value for {T}".replace("typing.", ""))
+        raise ValueError(f"invalid value for {_type_str(T)}")
 
     if args := getattr(T, "__args__", None):
         try:
             T_arg = args[0]
-            if T_arg == int:
-                return [x if type(x) == int else PyNumber_Long(x) for x in value]
-            if T_arg == str:
+            if is_homogeneous(value, T_arg):
+                return list(value)
+            if T_arg is int:
+                return [x if type(x) is int else PyNumber_Long(x) for x in value]
+            if T_arg is str:
                 return [validate_str(x, str) for x in value]
-            if T_arg == float:
-                return [x if type(x) == float else PyNumber_Float(x) for x in value]
+            if T_arg is bytes:
+                return [validate_bytes(x, bytes) for x in value]
+            if T_arg is float:
+                return [x if type(x) is float else PyNumber_Float(x) for x in value]
             validator = get_validator(T_arg)
-            if validator == validate_type:
-                origin = getattr(T_arg, "__origin__", T_arg)
-                return [getattr(x, "_cwtch_o", x) if isinstance(x, origin) else validator(x, T_arg) for x in value]
-            if validator == validate_any:
-                return [x for x in value]
             return [validator(x, T_arg) for x in value]
         except (TypeError, ValueError, ValidationError) as e:
             i: cython.int = 0
@@ -470,15 +534,11 @@ def validate_list(value, T, /):
 def validate_tuple(value, T, /):
     if isinstance(value, tuple):
         if (T_args := getattr(T, "__args__", None)) is not None:
-            if (len_v := len(value)) == 0 or (len_v == len(T_args) and T_args[-1] != Ellipsis):
+            if (len_v := len(value)) == 0 or (len_v == len(T_args) and T_args[-1] is not Ellipsis):
                 try:
                     return tuple(
                         [
-                            (
-                                PyNumber_Long(x)
-                                if T_args == int
-                                else get_validator(getattr(T_arg, "__origin__", T_arg))(x, T_arg)
-                            )
+                            x if type(x) is T_arg and is_pass_through_type(T_arg) else get_validator(T_arg)(x, T_arg)
                             for x, T_arg in zip(value, T_args)
                         ]
                     )
@@ -498,25 +558,23 @@ def validate_tuple(value, T, /):
                                 raise ValidationError(value, T, [e], path=path, path_value=v)
                     raise e
 
-            if T_args[-1] != Ellipsis:
+            if T_args[-1] is not Ellipsis:
                 raise ValueError(f"invalid arguments count for {T}")
 
             T_arg = T_args[0]
             try:
-                if T_arg == int:
-                    return tuple([x if type(x) == int else PyNumber_Long(x) for x in value])
-                if T_arg == str:
+                if is_homogeneous(value, T_arg):
+                    # items already have the exact type and tuples are immutable
+                    return value
+                if T_arg is int:
+                    return tuple([x if type(x) is int else PyNumber_Long(x) for x in value])
+                if T_arg is str:
                     return tuple([validate_str(x, str) for x in value])
-                if T_arg == float:
-                    return tuple([x if type(x) == float else PyNumber_Float(x) for x in value])
+                if T_arg is bytes:
+                    return tuple([validate_bytes(x, bytes) for x in value])
+                if T_arg is float:
+                    return tuple([x if type(x) is float else PyNumber_Float(x) for x in value])
                 validator = get_validator(T_arg)
-                if validator == validate_type:
-                    origin = getattr(T_arg, "__origin__", T_arg)
-                    return tuple(
-                        [getattr(x, "_cwtch_o", x) if isinstance(x, origin) else validator(x, T_arg) for x in value]
-                    )
-                if validator == validate_any:
-                    return value
                 return tuple([validator(x, T_arg) for x in value])
             except (TypeError, ValueError, ValidationError) as e:
                 i: cython.int = 0
@@ -537,18 +595,14 @@ def validate_tuple(value, T, /):
         return value
 
     if not isinstance(value, (list, set)):
-        raise ValueError(f"invalid value for {T}".replace("typing.", ""))
+        raise ValueError(f"invalid value for {_type_str(T)}")
 
     if (T_args := getattr(T, "__args__", None)) is not None:
-        if (len_v := len(value)) == 0 or (len_v == len(T_args) and T_args[-1] != Ellipsis):
+        if (len_v := len(value)) == 0 or (len_v == len(T_args) and T_args[-1] is not Ellipsis):
             try:
                 return tuple(
                     [
-                        (
-                            PyNumber_Long(x)
-                            if T_args == int
-                            else get_validator(getattr(T_arg, "__origin__", T_arg))(x, T_arg)
-                        )
+                        x if type(x) is T_arg and is_pass_through_type(T_arg) else get_validator(T_arg)(x, T_arg)
                         for x, T_arg in zip(value, T_args)
                     ]
                 )
@@ -568,25 +622,22 @@ def validate_tuple(value, T, /):
                             raise ValidationError(value, T, [e], path=path, path_value=v)
                 raise e
 
-        if T_args[-1] != Ellipsis:
+        if T_args[-1] is not Ellipsis:
             raise ValueError(f"invalid arguments count for {T}")
 
         T_arg = T_args[0]
         try:
-            if T_arg == int:
-                return tuple([x if type(x) == int else PyNumber_Long(x) for x in value])
-            if T_arg == str:
+            if is_homogeneous(value, T_arg):
+                return tuple(value)
+            if T_arg is int:
+                return tuple([x if type(x) is int else PyNumber_Long(x) for x in value])
+            if T_arg is str:
                 return tuple([validate_str(x, str) for x in value])
-            if T_arg == float:
-                return tuple([x if type(x) == float else PyNumber_Float(x) for x in value])
+            if T_arg is bytes:
+                return tuple([validate_bytes(x, bytes) for x in value])
+            if T_arg is float:
+                return tuple([x if type(x) is float else PyNumber_Float(x) for x in value])
             validator = get_validator(T_arg)
-            if validator == validate_type:
-                origin = getattr(T_arg, "__origin__", T_arg)
-                return tuple(
-                    [getattr(x, "_cwtch_o", x) if isinstance(x, origin) else validator(x, T_arg) for x in value]
-                )
-            if validator == validate_any:
-                return tuple(value)
             return tuple([validator(x, T_arg) for x in value])
         except (TypeError, ValueError, ValidationError) as e:
             i: cython.int = 0
@@ -613,20 +664,18 @@ def validate_set(value, T, /):
         if (args := getattr(T, "__args__", None)) is not None:
             try:
                 T_arg = args[0]
-                if T_arg == int:
-                    return set(x if type(x) == int else PyNumber_Long(x) for x in value)
-                if T_arg == str:
+                if is_homogeneous(value, T_arg):
+                    # items already have the exact type, copy without per item checks
+                    return set(value)
+                if T_arg is int:
+                    return set(x if type(x) is int else PyNumber_Long(x) for x in value)
+                if T_arg is str:
                     return set(validate_str(x, str) for x in value)
-                if T_arg == float:
-                    return set(x if type(x) == float else PyNumber_Float(x) for x in value)
+                if T_arg is bytes:
+                    return set(validate_bytes(x, bytes) for x in value)
+                if T_arg is float:
+                    return set(x if type(x) is float else PyNumber_Float(x) for x in value)
                 validator = get_validator(T_arg)
-                if validator == validate_type:
-                    origin = getattr(T_arg, "__origin__", T_arg)
-                    return set(
-                        getattr(x, "_cwtch_o", x) if isinstance(x, origin) else validator(x, T_arg) for x in value
-                    )
-                if validator == validate_any:
-                    return value
                 return set(validator(x, T_arg) for x in value)
             except (TypeError, ValueError, ValidationError) as e:
                 i: cython.int = 0
@@ -647,23 +696,22 @@ def validate_set(value, T, /):
         return value
 
     if not isinstance(value, (list, tuple)):
-        raise ValueError(f"invalid value for {T}".replace("typing.", ""))
+        raise ValueError(f"invalid value for {_type_str(T)}")
 
     if args := getattr(T, "__args__", None):
         try:
             T_arg = args[0]
-            if T_arg == int:
-                return set(x if type(x) == int else PyNumber_Long(x) for x in value)
-            if T_arg == str:
+            if is_homogeneous(value, T_arg):
+                return set(value)
+            if T_arg is int:
+                return set(x if type(x) is int else PyNumber_Long(x) for x in value)
+            if T_arg is str:
                 return set(validate_str(x, str) for x in value)
-            if T_arg == float:
-                return set(x if type(x) == float else PyNumber_Float(x) for x in value)
+            if T_arg is bytes:
+                return set(validate_bytes(x, bytes) for x in value)
+            if T_arg is float:
+                return set(x if type(x) is float else PyNumber_Float(x) for x in value)
             validator = get_validator(T_arg)
-            if validator == validate_type:
-                origin = getattr(T_arg, "__origin__", T_arg)
-                return set(getattr(x, "_cwtch_o", x) if isinstance(x, origin) else validator(x, T_arg) for x in value)
-            if validator == validate_any:
-                return set(x for x in value)
             return set(validator(x, T_arg) for x in value)
         except (TypeError, ValueError, ValidationError) as e:
             i: cython.int = 0
@@ -687,30 +735,33 @@ def validate_set(value, T, /):
 @cython.cfunc
 def validate_dict(value, T, /):
     if not isinstance(value, dict):
-        raise ValueError(f"invalid value for {T}".replace("typing.", ""))
+        raise ValueError(f"invalid value for {_type_str(T)}")
     if (args := getattr(T, "__args__", None)) is not None:
         T_k, T_v = args
+        if is_homogeneous_dict(value, T_k, T_v):
+            # keys and values already have the exact types, copy without per item checks
+            return dict(value)
         origin_v = getattr(T_v, "__origin__", None)
-        validator_v = get_validator(origin_v or T_v)
+        validator_v = get_validator(T_v)
         try:
-            if T_k == str:
+            if T_k is str:
                 if origin_v:
                     return {validate_str(k, T_k): validator_v(v, T_v) for k, v in value.items()}
-                return {validate_str(k, T_k): v if type(v) == T_v else validator_v(v, T_v) for k, v in value.items()}
+                return {validate_str(k, T_k): v if type(v) is T_v else validator_v(v, T_v) for k, v in value.items()}
             origin_k = getattr(T_k, "__origin__", None)
-            validator_k = get_validator(origin_k or T_k)
+            validator_k = get_validator(T_k)
             if origin_k is None and origin_v is None:
                 return {
-                    k if type(k) == T_k else validator_k(k, T_k): v if type(v) == T_v else validator_v(v, T_v)
+                    k if type(k) is T_k else validator_k(k, T_k): v if type(v) is T_v else validator_v(v, T_v)
                     for k, v in value.items()
                 }
             if origin_k and origin_v:
                 return {validator_k(k, T_k): validator_v(v, T_v) for k, v in value.items()}
             if origin_v:
-                return {k if type(k) == T_k else validator_k(k, T_k): validator_v(v, T_v) for k, v in value.items()}
-            return {validator_k(k, T_k): v if type(v) == T_v else validator_v(v, T_v) for k, v in value.items()}
+                return {k if type(k) is T_k else validator_k(k, T_k): validator_v(v, T_v) for k, v in value.items()}
+            return {validator_k(k, T_k): v if type(v) is T_v else validator_v(v, T_v) for k, v in value.items()}
         except (TypeError, ValueError, ValidationError) as e:
-            validator_k = get_validator(getattr(T_k, "__origin__", T_k))
+            validator_k = get_validator(T_k)
             for k, v in value.items():
                 try:
                     validator_k(k, T_k)
@@ -738,30 +789,30 @@ def validate_dict(value, T, /):
 @cython.cfunc
 def validate_mapping(value, T, /):
     if not isinstance(value, Mapping):
-        raise ValueError(f"invalid value for {T}".replace("typing.", ""))
+        raise ValueError(f"invalid value for {_type_str(T)}")
     if (args := getattr(T, "__args__", None)) is not None:
         T_k, T_v = args
         origin_v = getattr(T_v, "__origin__", None)
-        validator_v = get_validator(origin_v or T_v)
+        validator_v = get_validator(T_v)
         try:
-            if T_k == str:
+            if T_k is str:
                 if origin_v:
                     return {validate_str(k, T_k): validator_v(v, T_v) for k, v in value.items()}
-                return {validate_str(k, T_k): v if type(v) == T_v else validator_v(v, T_v) for k, v in value.items()}
+                return {validate_str(k, T_k): v if type(v) is T_v else validator_v(v, T_v) for k, v in value.items()}
             origin_k = getattr(T_k, "__origin__", None)
-            validator_k = get_validator(origin_k or T_k)
+            validator_k = get_validator(T_k)
             if origin_k is None and origin_v is None:
                 return {
-                    k if type(k) == T_k else validator_k(k, T_k): v if type(v) == T_v else validator_v(v, T_v)
+                    k if type(k) is T_k else validator_k(k, T_k): v if type(v) is T_v else validator_v(v, T_v)
                     for k, v in value.items()
                 }
             if origin_k and origin_v:
                 return {validator_k(k, T_k): validator_v(v, T_v) for k, v in value.items()}
             if origin_v:
-                return {k if type(k) == T_k else validator_k(k, T_k): validator_v(v, T_v) for k, v in value.items()}
-            return {validator_k(k, T_k): v if type(v) == T_v else validator_v(v, T_v) for k, v in value.items()}
+                return {k if type(k) is T_k else validator_k(k, T_k): validator_v(v, T_v) for k, v in value.items()}
+            return {validator_k(k, T_k): v if type(v) is T_v else validator_v(v, T_v) for k, v in value.items()}
         except (TypeError, ValueError, ValidationError) as e:
-            validator_k = get_validator(getattr(T_k, "__origin__", T_k))
+            validator_k = get_validator(T_k)
             for k, v in value.items():
                 try:
                     validator_k(k, T_k)
@@ -786,11 +837,6 @@ def validate_mapping(value, T, /):
     return value
 
 
-@cython.cfunc
-def validate_generic_alias(value, T, /):
-    return get_validator(T.__origin__)(value, T)
-
-
 @cython.cfunc
 def validate_callable(value, T, /):
     if not callable(value):
@@ -798,44 +844,35 @@ def validate_callable(value, T, /):
     return value
 
 
-@cython.cfunc
-def validate_annotated(value, T, /):
-    __metadata__ = T.__metadata__
-
-    for metadata in __metadata__:
-        if isinstance(metadata, TypeMetadata):
-            value = metadata.before(value)
-
-    __origin__ = T.__origin__
-
-    value = get_validator(__origin__)(value, __origin__)
-
-    for metadata in __metadata__:
-        if isinstance(metadata, TypeMetadata):
-            value = metadata.after(value)
-
-    return value
+@functools.lru_cache(maxsize=1024)
+def _get_literal_values(T, /) -> tuple:
+    # bool values are kept apart so that True does not match 1 or 1.0 and 1 does not match True,
+    # other values are compared by equality, so str and int subclasses like enum members still match
+    args = T.__args__
+    return (
+        frozenset([arg for arg in args if type(arg) is not bool]),
+        frozenset([arg for arg in args if type(arg) is bool]),
+    )
 
 
-@cython.cfunc
-def validate_union(value, T, /):
-    for T_arg in T.__args__:
-        if getattr(T_arg, "__origin__", None) is None and (T_arg == Any or type(value) == T_arg):
-            return value
-    errors = []
-    for T_arg in T.__args__:
-        try:
-            return validate_value(value, T_arg)
-        except Exception as e:
-            errors.append(e)
-    raise ValidationError(value, T, errors)
+_enum_missing = Enum._missing_.__func__
 
 
 @cython.cfunc
-def validate_literal(value, T, /):
-    if value not in T.__args__:
-        raise ValidationError(value, T, [ValueError(f"value is not a one of {list(T.__args__)}")])
-    return value
+def validate_enum(value, T, /):
+    if type(value) is T:
+        return value
+    try:
+        return T._value2member_map_[value]
+    except KeyError:
+        if getattr(T._missing_, "__func__", None) is _enum_missing and not getattr(T, "_unhashable_values_", None):
+            # nothing else could match, fail without the enum constructor's lookup and exception chaining
+            raise ValueError(f"{value!r} is not a valid {T.__qualname__}")
+        # _missing_ hooks, flags and unhashable member values
+        return T(value)
+    except TypeError:
+        # unhashable values
+        return T(value)
 
 
 @cython.cfunc
@@ -849,6 +886,8 @@ def validate_abcmeta(value, T, /):
 def validate_date(value, T, /):
     if isinstance(value, str):
         return date_fromisoformat(value)
+    if type(value) is T:
+        return value
     return default_validator(value, T)
 
 
@@ -856,6 +895,8 @@ def validate_date(value, T, /):
 def validate_datetime(value, T, /):
     if isinstance(value, str):
         return datetime_fromisoformat(value)
+    if type(value) is T:
+        return value
     return default_validator(value, T)
 
 
@@ -866,7 +907,7 @@ def validate_typevar(value, T, /):
 
 @cython.cfunc
 def validate_type_wrapper(value, T, /):
-    if type(value) == T:
+    if type(value) is T:
         return value
     return T(get_validator(T._cwtch_T)(value, T._cwtch_T))
 
@@ -881,8 +922,84 @@ def default_validator(value, T, /):
     return T(value)
 
 
+validators_map = cython.declare(dict, {})
+
+
 def __():
-    validators_map = {}
+    def make_generic_alias_validator(T: Type, /) -> Callable[[Any, Type], Any]:
+        # generic aliases are validated by the validator of their origin, e.g. list[int] by validate_list
+        return get_validator(T.__origin__)
+
+    def make_annotated_validator(T: Type, /) -> Callable[[Any, Type], Any]:
+        # nested Annotated is already flattened by typing, so a single pass over the metadata is enough
+        befores = []
+        afters = []
+        for metadata in T.__metadata__:
+            if isinstance(metadata, TypeMetadata):
+                if (before := metadata.before) is not nop and type(metadata).before is not TypeMetadata.before:
+                    befores.append(before)
+                if (after := metadata.after) is not nop and type(metadata).after is not TypeMetadata.after:
+                    afters.append(after)
+        befores = tuple(befores)
+        afters = tuple(afters)
+        origin = T.__origin__
+        origin_validator = get_validator(origin)
+
+        def validate(value, T, /):
+            for before in befores:
+                value = before(value)
+            value = origin_validator(value, origin)
+            for after in afters:
+                value = after(value)
+            return value
+
+        if is_pass_through_type(origin):
+            # exact instances of the origin type are returned as is by its builtin validator
+
+            def validate_scalar(value, T, /):
+                for before in befores:
+                    value = before(value)
+                if type(value) is not origin:
+                    value = origin_validator(value, origin)
+                for after in afters:
+                    value = after(value)
+                return value
+
+            return validate_scalar
+
+        return validate
+
+    def make_literal_validator(T: Type, /) -> Callable[[Any, Type], Any]:
+        values, bool_values = _get_literal_values(T)
+
+        def validate(value, T, /):
+            if value not in (bool_values if type(value) is bool else values):
+                raise ValidationError(value, T, [ValueError(f"value is not a one of {list(T.__args__)}")])
+            return value
+
+        return validate
+
+    def make_union_validator(T: Type, /) -> Callable[[Any, Type], Any]:
+        T_args = T.__args__
+        exact_types = frozenset(T_arg for T_arg in T_args if getattr(T_arg, "__origin__", None) is None)
+        if Any in exact_types:
+            return validate_any
+        members = tuple((T_arg, get_validator(T_arg)) for T_arg in T_args)
+
+        def validate(value, T, /):
+            if type(value) in exact_types:
+                return value
+            errors = []
+            for T_arg, validator in members:
+                try:
+                    return validator(value, T_arg)
+                except ValidationError as e:
+                    errors.append(e)
+                except Exception as e:
+                    errors.append(ValidationError(value, T_arg, [e]))
+            raise ValidationError(value, T, errors)
+
+        return validate
 
     validators_map[None] = validate_none
     validators_map[None.__class__] = validate_none
@@ -899,16 +1016,17 @@ def __():
     validators_map[dict] = validate_dict
     validators_map[Mapping] = validate_mapping
     validators_map[_AnyMeta] = validate_any
-    validators_map[_AnnotatedAlias] = validate_annotated
-    validators_map[GenericAlias] = validate_generic_alias
-    validators_map[_GenericAlias] = validate_generic_alias
-    validators_map[_SpecialGenericAlias] = validate_generic_alias
-    validators_map[_LiteralGenericAlias] = validate_literal
+    validators_map[_AnnotatedAlias] = make_annotated_validator
+    validators_map[GenericAlias] = make_generic_alias_validator
+    validators_map[_GenericAlias] = validators_map[GenericAlias]
+    validators_map[_SpecialGenericAlias] = validators_map[GenericAlias]
+    validators_map[_LiteralGenericAlias] = make_literal_validator
     validators_map[_CallableType] = validate_callable
-    validators_map[types.UnionType] = validate_union
-    validators_map[typing.Union] = validate_union
-    validators_map[_UnionGenericAlias] = validate_union
+    validators_map[types.UnionType] = make_union_validator
+    validators_map[typing.Union] = validators_map[types.UnionType]
+    validators_map[_UnionGenericAlias] = validators_map[types.UnionType]
     validators_map[ABCMeta] = validate_abcmeta
+    validators_map[EnumType] = validate_enum
     validators_map[datetime.datetime] = validate_datetime
     validators_map[datetime.date] = validate_date
     validators_map[TypeVar] = validate_typevar
@@ -916,9 +1034,46 @@ def __():
 
     validators_map_get = validators_map.get
 
-    # @functools.cache
-    def get_validator(T: Type, /) -> Callabel[[Any, Type], Any]:
-        return validators_map_get(T) or validators_map_get(T.__class__) or default_validator
+    pass_through_validators.update(
+        {T: validators_map[T] for T in (int, float, str, bytes, bool, datetime.datetime, datetime.date)}
+    )
+
+    # map entries that build a validator once per type instead of validating values themselves
+    validator_factories = (
+        make_generic_alias_validator,
+        make_annotated_validator,
+        make_union_validator,
+        make_literal_validator,
+    )
+
+    def validator_cache_key(T: Type, /):
+        # typing compares unions regardless of member order, e.g. int | float == float | int,
+        # but union validators try members in order, so the key also keeps the nested arguments
+        if type(args := getattr(T, "__args__", None)) is not tuple:
+            return T
+        return T, tuple([validator_cache_key(arg) for arg in args])
+
+    @functools.lru_cache(maxsize=4096)
+    def resolve_validator(T: Type, key, /) -> Callable[[Any, Type], Any]:
+        validator = validators_map_get(T) or validators_map_get(T.__class__) or default_validator
+        if validator in validator_factories:
+            # origin validators, metadata hooks, union members and literal values are bound once per type
+            return validator(T)
+        return validator
+
+    # hashing an annotation walks its arguments and metadata, so look validators up by identity first;
+    # the annotation is stored with its validator to keep its id from being reused
+    validators_by_id = {}
+    validators_by_id_get = validators_by_id.get
+
+    def get_validator(T: Type, /) -> Callable[[Any, Type], Any]:
+        if (item := validators_by_id_get(id(T))) is not None:
+            return item[1]
+        validator = resolve_validator(T, validator_cache_key(T))
+        if len(validators_by_id) >= 4096:
+            validators_by_id.clear()
+        validators_by_id[id(T)] = (T, validator)
+        return validator
 
     def validate_value_using_validator(value: Any, T: Type, validator: Callable[[Any, Type], Any]):
         try:
@@ -929,6 +1084,8 @@ def __():
             raise ValidationError(value, T, [e])
 
     def validate_value(value: Any, T: Type):
+        if type(value) is T and is_pass_through_type(T):
+            return value
         try:
             return get_validator(T)(value, T)
         except ValidationError as e:
@@ -940,7 +1097,8 @@ def __():
         if T in validators_map and not force:
             raise Exception(f"validator for '{T}' already registered")
         validators_map[T] = validator
-        get_validator.cache_clear()
+        validators_by_id.clear()
+        resolve_validator.cache_clear()
 
     def make_json_schema(
         T,
@@ -1077,7 +1235,31 @@ def __():
             return make_json_schema_cwtch(T, ref_builder=ref_builder, context=context, default=default)
         raise Exception(f"missing json schema builder for {T}")
 
+    json_schema_refs = ContextVar("json_schema_refs", default=None)
+
     def make_json_schema_cwtch(T, ref_builder=None, context=None, default=None):
+        if not ref_builder:
+            return build_json_schema_cwtch(T, ref_builder=ref_builder, context=context, default=default)
+        # a model referenced from several fields is built once per top level make_json_schema call
+        token = None
+        if (built := json_schema_refs.get()) is None:
+            token = json_schema_refs.set(built := {})
+        try:
+            key = (T, ref_builder)
+            if (item := built.get(key)) is None:
+                item = built[key] = build_json_schema_cwtch(
+                    T,
+                    ref_builder=ref_builder,
+                    context=context,
+                    default=default,
+                )
+            schema, refs = item
+            return dict(schema), refs
+        finally:
+            if token is not None:
+                json_schema_refs.reset(token)
+
+    def build_json_schema_cwtch(T, ref_builder=None, context=None, default=None):
         schema = {"type": "object"}
         refs = {}
         properties = {}
@@ -1,5 +1,7 @@
+import dataclasses
+import gc
 import os
-import re
+import weakref
 
 from typing import Annotated, ForwardRef, Generic, Literal, Optional, TypeVar
 from unittest import mock
@@ -8,10 +10,10 @@ import pytest
 
 from typing_extensions import Doc
 
-from cwtch import asdict, dataclass, field, make_json_schema, validate_args, validate_value, view
-from cwtch.core import _MISSING
+from cwtch import asdict, dataclass, field, make_json_schema, register_validator, validate_args, validate_value, view
+from cwtch.core import _MISSING, get_validator
 from cwtch.errors import ValidationError
-from cwtch.metadata import Ge, Gt, JsonLoads, Le, Lt, MaxItems, MaxLen, MinItems, MinLen
+from cwtch.metadata import Ge, Gt, JsonLoads, Le, Lt, MaxItems, MaxLen, MinItems, MinLen, Validator
 from cwtch.types import UNSET, LowerStr, StrictBool, StrictFloat, StrictInt, StrictNumber, StrictStr, Unset, UpperStr
 
 
@@ -22,228 +24,165 @@ F = TypeVar("F")
 class TestMetadata:
     def test_ge(self):
         assert validate_value(1, Annotated[int, Ge(1)]) == 1
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[int, Ge(value=1)] ] input_type[ <class 'int'> ] input_value[ 0 ]\n"
-                    "  ValueError: value should be >= 1"
-                )
-            ),
-        ):
+        assert not hasattr(Ge(1), "__dict__")
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(0, Annotated[int, Ge(1)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[int, Ge(value=1)] ] input_type[ <class 'int'> ] input_value[ 0 ]\n"
+            "  ValueError: value should be >= 1"
+        )
 
         assert validate_value(1, Annotated[Annotated[int, Ge(0)], Ge(1)]) == 1
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[int, Ge(value=2), Ge(value=1)] ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
-                    "  ValueError: value should be >= 2"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(1, Annotated[Annotated[int, Ge(2)], Ge(1)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[int, Ge(value=2), Ge(value=1)] ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
+            "  ValueError: value should be >= 2"
+        )
 
     def test_gt(self):
         assert validate_value(1, Annotated[int, Gt(0)]) == 1
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[int, Gt(value=0)] ] input_type[ <class 'int'> ] input_value[ 0 ]\n"
-                    "  ValueError: value should be > 0"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(0, Annotated[int, Gt(0)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[int, Gt(value=0)] ] input_type[ <class 'int'> ] input_value[ 0 ]\n"
+            "  ValueError: value should be > 0"
+        )
 
         assert validate_value(2, Annotated[Annotated[int, Gt(0)], Gt(1)]) == 2
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[int, Gt(value=2), Gt(value=1)] ] input_type[ <class 'int'> ] input_value[ 2 ]\n"
-                    "  ValueError: value should be > 2"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(2, Annotated[Annotated[int, Gt(2)], Gt(1)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[int, Gt(value=2), Gt(value=1)] ] input_type[ <class 'int'> ] input_value[ 2 ]\n"
+            "  ValueError: value should be > 2"
+        )
 
     def test_le(self):
         assert validate_value(1, Annotated[int, Le(1)]) == 1
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[int, Le(value=1)] ] input_type[ <class 'int'> ] input_value[ 2 ]\n"
-                    "  ValueError: value should be <= 1"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(2, Annotated[int, Le(1)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[int, Le(value=1)] ] input_type[ <class 'int'> ] input_value[ 2 ]\n"
+            "  ValueError: value should be <= 1"
+        )
 
         assert validate_value(0, Annotated[Annotated[int, Le(0)], Le(1)]) == 0
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[int, Le(value=1), Le(value=2)] ] input_type[ <class 'int'> ] input_value[ 2 ]\n"
-                    "  ValueError: value should be <= 1"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(2, Annotated[Annotated[int, Le(1)], Le(2)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[int, Le(value=1), Le(value=2)] ] input_type[ <class 'int'> ] input_value[ 2 ]\n"
+            "  ValueError: value should be <= 1"
+        )
 
     def test_lt(self):
         assert validate_value(0, Annotated[int, Lt(1)]) == 0
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[int, Lt(value=0)] ] input_type[ <class 'int'> ] input_value[ 0 ]\n"
-                    "  ValueError: value should be < 0"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(0, Annotated[int, Lt(0)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[int, Lt(value=0)] ] input_type[ <class 'int'> ] input_value[ 0 ]\n"
+            "  ValueError: value should be < 0"
+        )
 
         assert validate_value(0, Annotated[Annotated[int, Lt(1)], Lt(2)]) == 0
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[int, Lt(value=0), Lt(value=1)] ] input_type[ <class 'int'> ] input_value[ 0 ]\n"
-                    "  ValueError: value should be < 0"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(0, Annotated[Annotated[int, Lt(0)], Lt(1)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[int, Lt(value=0), Lt(value=1)] ] input_type[ <class 'int'> ] input_value[ 0 ]\n"
+            "  ValueError: value should be < 0"
+        )
 
     def test_validate_min_len(self):
         assert validate_value("a", Annotated[str, MinLen(1)]) == "a"
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[str, MinLen(value=1)] ] input_type[ <class 'str'> ] input_value[ '' ]\n"
-                    "  ValueError: value length should be >= 1"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("", Annotated[str, MinLen(1)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[str, MinLen(value=1)] ] input_type[ <class 'str'> ] input_value[ '' ]\n"
+            "  ValueError: value length should be >= 1"
+        )
 
         assert validate_value("ab", Annotated[Annotated[str, MinLen(2)], MinLen(1)]) == "ab"
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[str, MinLen(value=2), MinLen(value=1)] ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
-                    "  ValueError: value length should be >= 2"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("a", Annotated[Annotated[str, MinLen(2)], MinLen(1)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[str, MinLen(value=2), MinLen(value=1)] ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
+            "  ValueError: value length should be >= 2"
+        )
 
     def test_validate_max_len(self):
         assert validate_value("a", Annotated[str, MaxLen(1)]) == "a"
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[str, MaxLen(value=1)] ] input_type[ <class 'str'> ] input_value[ 'ab' ]\n"
-                    "  ValueError: value length should be <= 1"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("ab", Annotated[str, MaxLen(1)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[str, MaxLen(value=1)] ] input_type[ <class 'str'> ] input_value[ 'ab' ]\n"
+            "  ValueError: value length should be <= 1"
+        )
 
         assert validate_value("a", Annotated[Annotated[str, MaxLen(1)], MaxLen(2)]) == "a"
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[str, MaxLen(value=1), MaxLen(value=2)] ] input_type[ <class 'str'> ] input_value[ 'ab' ]\n"
-                    "  ValueError: value length should be <= 1"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("ab", Annotated[Annotated[str, MaxLen(1)], MaxLen(2)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[str, MaxLen(value=1), MaxLen(value=2)] ] input_type[ <class 'str'> ] input_value[ 'ab' ]\n"
+            "  ValueError: value length should be <= 1"
+        )
 
     def test_validate_min_items(self):
         assert validate_value([0], Annotated[list, MinItems(1)]) == [0]
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[list, MinItems(value=1)] ] input_type[ <class 'list'> ] input_value[ [] ]\n"
-                    "  ValueError: items count should be >= 1"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value([], Annotated[list, MinItems(1)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[list, MinItems(value=1)] ] input_type[ <class 'list'> ] input_value[ [] ]\n"
+            "  ValueError: items count should be >= 1"
+        )
 
         assert validate_value([0, 1], Annotated[Annotated[list, MinItems(2)], MinItems(1)]) == [0, 1]
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[list, MinItems(value=2), MinItems(value=1)] ] input_type[ <class 'list'> ] input_value[ [0] ]\n"
-                    "  ValueError: items count should be >= 2"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value([0], Annotated[Annotated[list, MinItems(2)], MinItems(1)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[list, MinItems(value=2), MinItems(value=1)] ] input_type[ <class 'list'> ] input_value[ [0] ]\n"
+            "  ValueError: items count should be >= 2"
+        )
 
     def test_validate_max_items(self):
         assert validate_value([0], Annotated[list, MaxItems(1)]) == [0]
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[list, MaxItems(value=1)] ] input_type[ <class 'list'> ] input_value[ [0, 1] ]\n"
-                    "  ValueError: items count should be <= 1"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value([0, 1], Annotated[list, MaxItems(1)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[list, MaxItems(value=1)] ] input_type[ <class 'list'> ] input_value[ [0, 1] ]\n"
+            "  ValueError: items count should be <= 1"
+        )
 
         assert validate_value([0], Annotated[Annotated[list, MaxItems(1)], MaxItems(2)]) == [0]
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[list, MaxItems(value=1), MaxItems(value=2)] ] input_type[ <class 'list'> ] input_value[ [0, 1] ]\n"
-                    "  ValueError: items count should be <= 1"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value([0, 1], Annotated[Annotated[list, MaxItems(1)], MaxItems(2)])
+        assert str(excinfo.value) == (
+            "type[ Annotated[list, MaxItems(value=1), MaxItems(value=2)] ] input_type[ <class 'list'> ] input_value[ [0, 1] ]\n"
+            "  ValueError: items count should be <= 1"
+        )
 
     def test_validate_annotated_complex(self):
         assert validate_value([1, 2], list[Annotated[int, Ge(1)]]) == [1, 2]
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ list[Annotated[int, Ge(value=1)]] ] input_type[ <class 'list'> ] path[ 2 ] path_value[ 0 ] path_value_type[ <class 'int'> ]\n"
-                    "  ValueError: value should be >= 1"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value([1, 2, 0], list[Annotated[int, Ge(1)]])
+        assert str(excinfo.value) == (
+            "type[ list[Annotated[int, Ge(value=1)]] ] input_type[ <class 'list'> ] path[ 2 ] path_value[ 0 ] path_value_type[ <class 'int'> ]\n"
+            "  ValueError: value should be >= 1"
+        )
 
         assert validate_value((1, 2), list[Annotated[int, Ge(1)]]) == [1, 2]
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ list[Annotated[int, Ge(value=1)]] ] input_type[ <class 'tuple'> ] path[ 2 ] path_value[ 0 ] path_value_type[ <class 'int'> ]\n"
-                    "  ValueError: value should be >= 1"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value((1, 2, 0), list[Annotated[int, Ge(1)]])
+        assert str(excinfo.value) == (
+            "type[ list[Annotated[int, Ge(value=1)]] ] input_type[ <class 'tuple'> ] path[ 2 ] path_value[ 0 ] path_value_type[ <class 'int'> ]\n"
+            "  ValueError: value should be >= 1"
+        )
+
+    def test_validator(self):
+        T = Annotated[int, Validator(before=lambda v: v.strip(), after=lambda v: v * 2), Ge(10)]
+        assert validate_value(" 5 ", T) == 10
+        assert validate_value(" 5 ", Annotated[T, Validator(after=lambda v: v + 1)]) == 11
+        with pytest.raises(ValidationError) as excinfo:
+            validate_value(" 4 ", T)
+        assert str(excinfo.value).splitlines()[-1] == "  ValueError: value should be >= 10"
 
     def test_lower(self):
         assert validate_value("A", LowerStr) == "a"
@@ -255,118 +194,80 @@ class TestMetadata:
 
     def test_strict_int(self):
         assert validate_value(1, StrictInt) == 1
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[int, Strict(type=[<class 'int'>])] ] input_type[ <class 'str'> ] input_value[ '1' ]\n"
-                    "  ValueError: invalid value for <class 'int'>"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("1", StrictInt)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[int, Strict(type=[<class 'int'>])] ] input_type[ <class 'bool'> ] input_value[ True ]\n"
-                    "  ValueError: invalid value for <class 'int'>"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ Annotated[int, Strict(type=[<class 'int'>])] ] input_type[ <class 'str'> ] input_value[ '1' ]\n"
+            "  ValueError: invalid value for <class 'int'>"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(True, StrictInt)
+        assert str(excinfo.value) == (
+            "type[ Annotated[int, Strict(type=[<class 'int'>])] ] input_type[ <class 'bool'> ] input_value[ True ]\n"
+            "  ValueError: invalid value for <class 'int'>"
+        )
 
     def test_strict_float(self):
         assert validate_value(1.1, StrictFloat) == 1.1
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[float, Strict(type=[<class 'float'>])] ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
-                    "  ValueError: invalid value for <class 'float'>"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(1, StrictFloat)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[float, Strict(type=[<class 'float'>])] ] input_type[ <class 'bool'> ] input_value[ True ]\n"
-                    "  ValueError: invalid value for <class 'float'>"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ Annotated[float, Strict(type=[<class 'float'>])] ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
+            "  ValueError: invalid value for <class 'float'>"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(True, StrictFloat)
+        assert str(excinfo.value) == (
+            "type[ Annotated[float, Strict(type=[<class 'float'>])] ] input_type[ <class 'bool'> ] input_value[ True ]\n"
+            "  ValueError: invalid value for <class 'float'>"
+        )
 
     def test_strict_number(self):
         assert validate_value(1, StrictNumber) == 1
         assert validate_value(1.1, StrictNumber) == 1.1
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Union[Annotated[int, Strict(type=[<class 'int'>])], "
-                    "Annotated[float, Strict(type=[<class 'float'>])]] ] input_type[ <class 'str'> ] input_value[ '1' ]\n"
-                    "  type[ Annotated[int, Strict(type=[<class 'int'>])] ] input_type[ <class 'str'> ]\n"
-                    "    ValueError: invalid value for <class 'int'>\n"
-                    "  type[ Annotated[float, Strict(type=[<class 'float'>])] ] input_type[ <class 'str'> ]\n"
-                    "    ValueError: invalid value for <class 'float'>"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("1", StrictNumber)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Union[Annotated[int, Strict(type=[<class 'int'>])], "
-                    "Annotated[float, Strict(type=[<class 'float'>])]] ] input_type[ <class 'bool'> ] input_value[ True ]\n"
-                    "  type[ Annotated[int, Strict(type=[<class 'int'>])] ] input_type[ <class 'bool'> ]\n"
-                    "    ValueError: invalid value for <class 'int'>\n"
-                    "  type[ Annotated[float, Strict(type=[<class 'float'>])] ] input_type[ <class 'bool'> ]\n"
-                    "    ValueError: invalid value for <class 'float'>"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ Union[Annotated[int, Strict(type=[<class 'int'>])], Annotated[float, Strict(type=[<class 'float'>])]] ] input_type[ <class 'str'> ] input_value[ '1' ]\n"
+            "  type[ Annotated[int, Strict(type=[<class 'int'>])] ] input_type[ <class 'str'> ]\n"
+            "    ValueError: invalid value for <class 'int'>\n"
+            "  type[ Annotated[float, Strict(type=[<class 'float'>])] ] input_type[ <class 'str'> ]\n"
+            "    ValueError: invalid value for <class 'float'>"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(True, StrictNumber)
+        assert str(excinfo.value) == (
+            "type[ Union[Annotated[int, Strict(type=[<class 'int'>])], Annotated[float, Strict(type=[<class 'float'>])]] ] input_type[ <class 'bool'> ] input_value[ True ]\n"
+            "  type[ Annotated[int, Strict(type=[<class 'int'>])] ] input_type[ <class 'bool'> ]\n"
+            "    ValueError: invalid value for <class 'int'>\n"
+            "  type[ Annotated[float, Strict(type=[<class 'float'>])] ] input_type[ <class 'bool'> ]\n"
+            "    ValueError: invalid value for <class 'float'>"
+        )
 
     def test_strict_str(self):
         assert validate_value("a", StrictStr) == "a"
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[str, Strict(type=[<class 'str'>])] ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
-                    "  ValueError: invalid value for <class 'str'>"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(1, StrictStr)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[str, Strict(type=[<class 'str'>])] ] input_type[ <class 'bool'> ] input_value[ True ]\n"
-                    "  ValueError: invalid value for <class 'str'>"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ Annotated[str, Strict(type=[<class 'str'>])] ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
+            "  ValueError: invalid value for <class 'str'>"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(True, StrictStr)
+        assert str(excinfo.value) == (
+            "type[ Annotated[str, Strict(type=[<class 'str'>])] ] input_type[ <class 'bool'> ] input_value[ True ]\n"
+            "  ValueError: invalid value for <class 'str'>"
+        )
 
     def test_strict_bool(self):
         assert validate_value(True, StrictBool) is True
         assert validate_value(False, StrictBool) is False
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Annotated[bool, Strict(type=[<class 'bool'>])] ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
-                    "  ValueError: invalid value for <class 'bool'>"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(1, StrictBool)
+        assert str(excinfo.value) == (
+            "type[ Annotated[bool, Strict(type=[<class 'bool'>])] ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
+            "  ValueError: invalid value for <class 'bool'>"
+        )
 
 
 class TestModel:
@@ -438,17 +339,13 @@ class TestModel:
             i: int
             s: str = "s"
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'test_cwtch.M'> ] path[ 'i' ]\n"
-                    "  type[ <class 'int'> ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
-                    "    ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             M(i="a")
+        assert str(excinfo.value) == (
+            "type[ <class 'test_cwtch.M'> ] path[ 'i' ]\n"
+            "  type[ <class 'int'> ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
+            "    ValueError: invalid literal for int() with base 10: 'a'"
+        )
 
     def test_list(self):
         @dataclass
@@ -512,11 +409,9 @@ class TestModel:
         class M:
             i: int
 
-        with pytest.raises(
-            TypeError,
-            match=re.escape("M.__init__() got an unexpected keyword argument 's'"),
-        ):
+        with pytest.raises(TypeError) as excinfo:
             M(i=0, s="s")
+        assert str(excinfo.value) == "M.__init__() got an unexpected keyword argument 's'"
 
     def test_env(self):
         @dataclass(env_prefix="TEST_")
@@ -565,6 +460,16 @@ class TestModel:
             assert M().i == 0
             assert M().j == 0
 
+    def test_env_field_names(self):
+        @dataclass(env_prefix="TEST_")
+        class M:
+            f: float = 1.0
+            key: str = "a"
+            keys: list = field(default_factory=list)
+
+        with mock.patch.dict(os.environ, {"TEST_KEY": "b"}, clear=True):
+            assert M() == M(f=1.0, key="b", keys=[])
+
     def test_env_json(self):
         @dataclass(env_prefix="TEST_")
         class M:
@@ -597,30 +502,23 @@ class TestModel:
 
         assert validate_value({"x": ["1"]}, C[int]).x == [1]
         assert C[int](x=["1"]).x == [1]
+        assert C[int] is C[int]
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'cwtch.cwtch.C[int]'> ] path[ 'x' ]\n"
-                    "  type[ list[int] ] input_type[ <class 'list'> ] path[ 0 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "    ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value({"x": ["a"]}, C[int])
+        assert str(excinfo.value) == (
+            "type[ <class 'cwtch.cwtch.C[int]'> ] path[ 'x' ]\n"
+            "  type[ list[int] ] input_type[ <class 'list'> ] path[ 0 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "    ValueError: invalid literal for int() with base 10: 'a'"
+        )
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'cwtch.cwtch.C[int]'> ] path[ 'x' ]\n"
-                    "  type[ list[int] ] input_type[ <class 'list'> ] path[ 0 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "    ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             C[int](x=["a"])
+        assert str(excinfo.value) == (
+            "type[ <class 'cwtch.cwtch.C[int]'> ] path[ 'x' ]\n"
+            "  type[ list[int] ] input_type[ <class 'list'> ] path[ 0 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "    ValueError: invalid literal for int() with base 10: 'a'"
+        )
 
     def test_init(self):
         @dataclass
@@ -630,11 +528,40 @@ class TestModel:
         M(0)
         M(i=0)
 
-        with pytest.raises(
-            TypeError,
-            match=re.escape("M.__init__() missing required positional argument: 'i'"),
-        ):
+        with pytest.raises(TypeError) as excinfo:
             M()
+        assert str(excinfo.value) == "M.__init__() missing required positional argument: 'i'"
+
+        @dataclass
+        class M:
+            type: str
+            id: int
+
+        m = M(type="a", id="1")
+        assert m.type == "a"
+        assert m.id == 1
+
+    def test_registered_scalar_validator(self):
+        validate_int = get_validator(int)
+
+        def validate_positive_int(value, T, /):
+            value = validate_int(value, T)
+            if value < 0:
+                raise ValueError("negative")
+            return value
+
+        register_validator(int, validate_positive_int, force=True)
+        try:
+
+            @dataclass
+            class M:
+                i: int
+
+            assert M(i=1).i == 1
+            with pytest.raises(ValidationError):
+                M(i=-1)
+        finally:
+            register_validator(int, validate_int, force=True)
 
     def test_post_init(self):
         @dataclass
@@ -656,6 +583,19 @@ class TestModel:
         assert b.x == 1
         assert b.s == "s"
 
+        @dataclass
+        class C:
+            x: int
+
+            def __post_init__(self):
+                if self.x < 0:
+                    raise ValueError("x should be >= 0")
+
+        assert C(x=0).x == 0
+        with pytest.raises(ValidationError) as excinfo:
+            C(x=-1)
+        assert str(excinfo.value).splitlines()[-1] == "  ValueError: x should be >= 0"
+
     def test_default_factory(self):
         @dataclass
         class M:
@@ -763,11 +703,9 @@ class TestModel:
         assert m.j == 1
         assert m.s == "a"
 
-        with pytest.raises(
-            TypeError,
-            match=re.escape("M.__init__() takes from 1 to 3 positional arguments but 4 were given"),
-        ):
+        with pytest.raises(TypeError) as excinfo:
             m = M(0, 1, "a")
+        assert str(excinfo.value) == "M.__init__() takes from 1 to 3 positional arguments but 4 were given"
 
     def test_rebuild(self):
         @dataclass
@@ -813,6 +751,23 @@ class TestModel:
         assert b.d is None
         assert b.e == 3
 
+    def test_instances_are_not_retained(self):
+        @dataclass
+        class A:
+            i: int
+
+        @dataclass
+        class B:
+            a: A
+            l: list[A]
+
+        data = {"a": {"i": "1"}, "l": [{"i": 2}]}
+        b = validate_value(data, B)
+        refs = [weakref.ref(b), weakref.ref(b.a), weakref.ref(b.l[0])]
+        del b
+        gc.collect()
+        assert all(ref() is None for ref in refs)
+
 
 class TestView:
     def test_dict(self):
@@ -983,8 +938,9 @@ class TestView:
         v1 = M.V1(i="1", b="n")
         assert v1.i == 1
 
-        with pytest.raises(TypeError, match=re.escape("V2.__init__() got an unexpected keyword argument 'b'")):
+        with pytest.raises(TypeError) as excinfo:
             v2 = M.V2(i="1", b="n")
+        assert str(excinfo.value) == "V2.__init__() got an unexpected keyword argument 'b'"
 
     def test_validate(self):
         @dataclass
@@ -1026,6 +982,20 @@ class TestView:
         assert B.__dataclass_fields__["a"].type == Optional[list[A]]
         assert B.V.__dataclass_fields__["a"].type == Optional[list[A.V]]
 
+        bv = B(a=[A(i=1, s="s")]).V()
+        assert isinstance(bv.a[0], A.V)
+        assert asdict(bv) == {"a": [{"i": 1}]}
+
+        @view(B, "W", validate=False)
+        class BW:
+            pass
+
+        b = B(a=[A(i=1, s="s")])
+        bw = b.W()
+        assert bw.a == [{"i": 1, "s": "s"}]
+        bw.a.append(None)
+        assert b.a == [A(i=1, s="s")]
+
     def test_inheritance(self):
         @dataclass
         class A:
@@ -1181,6 +1151,21 @@ class TestJsonSchema:
             },
         )
 
+        @dataclass
+        class Parent:
+            a: Model
+            b: Annotated[Model, Doc("This is doc")]
+            c: list[Model]
+
+        schema, refs = make_json_schema(Parent)
+        assert schema == {"$ref": "#/$defs/Parent"}
+        assert refs["Parent"]["properties"] == {
+            "a": {"$ref": "#/$defs/Model"},
+            "b": {"$ref": "#/$defs/Model", "description": "This is doc"},
+            "c": {"type": "array", "items": {"$ref": "#/$defs/Model"}},
+        }
+        assert refs["Model"] == make_json_schema(list[Model])[1]["Model"]
+
         @dataclass
         class GenericModel(Generic[T, F]):
             a: T
@@ -1217,5 +1202,35 @@ def test_validate_call():
 
     assert validate_args(foo, ("a", 1), {}) == (("a", 1), {})
     assert validate_args(foo, ("a", "1"), {}) == (("a", 1), {})
+    assert validate_args(foo, ("a",), {"i": "1"}) == (("a",), {"i": 1})
     with pytest.raises(TypeError):
         validate_args(foo, ("a",), {"i": "a"})
+
+    class A:
+        def __init__(self, value):
+            self.value = value
+
+    def bar(a: A):
+        pass
+
+    assert validate_args(bar, (1,), {})[0][0].value == 1
+    register_validator(A, lambda value, T: T(value * 2))
+    assert validate_args(bar, (1,), {})[0][0].value == 2
+
+    @dataclasses.dataclass
+    class C:
+        x: int = 0
+
+        def __call__(self, i: int):
+            pass
+
+        def method(self, i: int):
+            pass
+
+    c = C()
+    assert validate_args(c, ("1",), {}) == ((1,), {})
+    assert validate_args(c.method, ("1",), {}) == ((1,), {})
+    ref = weakref.ref(c)
+    del c
+    gc.collect()
+    assert ref() is None
@@ -1,5 +1,3 @@
-import re
-
 from typing import Generic, TypeVar
 
 import pytest
@@ -19,29 +17,21 @@ class TestGeneric:
         assert validate_value({"l": ["1"]}, M[int]).l == [1]
         assert M[int](l=["1"]).l == [1]
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'cwtch.cwtch.M[int]'> ] path[ 'l' ]\n"
-                    "  type[ list[int] ] input_type[ <class 'list'> ] path[ 0 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "    ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value({"l": ["a"]}, M[int])
+        assert str(excinfo.value) == (
+            "type[ <class 'cwtch.cwtch.M[int]'> ] path[ 'l' ]\n"
+            "  type[ list[int] ] input_type[ <class 'list'> ] path[ 0 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "    ValueError: invalid literal for int() with base 10: 'a'"
+        )
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'cwtch.cwtch.M[int]'> ] path[ 'l' ]\n"
-                    "  type[ list[int] ] input_type[ <class 'list'> ] path[ 0 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "    ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             M[int](l=["a"])
+        assert str(excinfo.value) == (
+            "type[ <class 'cwtch.cwtch.M[int]'> ] path[ 'l' ]\n"
+            "  type[ list[int] ] input_type[ <class 'list'> ] path[ 0 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "    ValueError: invalid literal for int() with base 10: 'a'"
+        )
 
     def test_view(self):
         T = TypeVar("T")
@@ -1,4 +1,4 @@
-import time
+import gc
 
 import psutil
 
@@ -64,13 +64,16 @@ def test_memory_leak():
     for _ in range(5):
         [C(**data) for _ in range(1000)]
 
-    memory_start = p.memory_full_info()
+    gc.collect()
+    memory_start = p.memory_info()
 
-    for _ in range(1000):
+    for i in range(1000):
         [C(**data) for _ in range(1000)]
-        time.sleep(0.002)
+        if i % 100 == 0:
+            gc.collect()
 
-    memory_end = p.memory_full_info()
+    gc.collect()
+    memory_end = p.memory_info()
 
     diff = memory_end.rss - memory_start.rss
     assert diff < 4 * 1024**2, (diff, memory_start, memory_end)
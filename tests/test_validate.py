@@ -1,5 +1,3 @@
-import re
-
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import date, datetime, timezone
 from enum import Enum
@@ -7,72 +5,65 @@ from typing import Annotated, Any, Dict, List, Literal, Set, Tuple, Type, TypeVa
 
 import pytest
 
-from cwtch import validate_value
+from cwtch import register_validator, validate_value
+from cwtch.core import get_validator, is_pass_through_type
 from cwtch.errors import ValidationError
-from cwtch.metadata import Ge
+from cwtch.metadata import Ge, MinLen
 from cwtch.types import UNSET, UnsetType
 
 
 class TestValidateValue:
     def test_none(self):
         assert validate_value(None, None) is None
-        for value in (0, 0.0, 1000, ..., "a", True, False, UNSET, object(), (), [], {}, int):
-            with pytest.raises(ValidationError, match=re.escape("ValueError: value is not a None")):
-                validate_value(value, None)
+
+    @pytest.mark.parametrize("value", [0, 0.0, 1000, ..., "a", True, False, UNSET, object(), (), [], {}, int])
+    def test_none_errors(self, value):
+        with pytest.raises(ValidationError) as excinfo:
+            validate_value(value, None)
+        assert str(excinfo.value).splitlines()[-1] == "  ValueError: value is not a None"
 
     def test_unset(self):
         assert validate_value(UNSET, UnsetType) is UNSET
-        for value in (0, 0.0, 1000, ..., "a", True, False, None, object(), (), [], {}, int):
-            with pytest.raises(
-                ValidationError, match=re.escape("ValueError: value is not a valid <class 'cwtch.core.UnsetType'>")
-            ):
-                validate_value(value, UnsetType)
-
-    def test_bool(self):
-        for value in (1, "1", "true", "True", "TRUE", "y", "Y", "t", "yes", "Yes", "YES"):
-            assert validate_value(value, bool) is True
-        for value in (0, "0", "false", "False", "FALSE", "n", "N", "f", "no", "No", "NO"):
-            assert validate_value(value, bool) is False
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'bool'> ] input_type[ <class 'int'> ] input_value[ -2 ]\n"
-                    "  ValueError: could not convert value to bool"
-                )
-            ),
-        ):
+
+    @pytest.mark.parametrize("value", [0, 0.0, 1000, ..., "a", True, False, None, object(), (), [], {}, int])
+    def test_unset_errors(self, value):
+        with pytest.raises(ValidationError) as excinfo:
+            validate_value(value, UnsetType)
+        assert str(excinfo.value).splitlines()[-1] == "  ValueError: value is not a valid <class 'cwtch.core.UnsetType'>"
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [(value, True) for value in (1, "1", "true", "True", "TRUE", "y", "Y", "t", "yes", "Yes", "YES")]
+        + [(value, False) for value in (0, "0", "false", "False", "FALSE", "n", "N", "f", "no", "No", "NO")],
+    )
+    def test_bool(self, value, expected):
+        assert validate_value(value, bool) is expected
+
+    def test_bool_errors(self):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(-2, bool)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'bool'> ] input_type[ <class 'int'> ] input_value[ 2 ]\n"
-                    "  ValueError: could not convert value to bool"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ <class 'bool'> ] input_type[ <class 'int'> ] input_value[ -2 ]\n"
+            "  ValueError: could not convert value to bool"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(2, bool)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'bool'> ] input_type[ <class 'str'> ] input_value[ 'ok' ]\n"
-                    "  ValueError: could not convert value to bool"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ <class 'bool'> ] input_type[ <class 'int'> ] input_value[ 2 ]\n"
+            "  ValueError: could not convert value to bool"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("ok", bool)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'bool'> ] input_type[ <class 'str'> ] input_value[ 'fail' ]\n"
-                    "  ValueError: could not convert value to bool"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ <class 'bool'> ] input_type[ <class 'str'> ] input_value[ 'ok' ]\n"
+            "  ValueError: could not convert value to bool"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("fail", bool)
+        assert str(excinfo.value) == (
+            "type[ <class 'bool'> ] input_type[ <class 'str'> ] input_value[ 'fail' ]\n"
+            "  ValueError: could not convert value to bool"
+        )
 
     def test_int(self):
         assert validate_value(-1, int) == -1
@@ -81,26 +72,18 @@ class TestValidateValue:
         assert validate_value("1", int) == 1
         assert validate_value(True, int) == 1
         assert validate_value(False, int) == 0
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'int'> ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
-                    "  ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("a", int)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'int'> ] input_type[ <class 'NoneType'> ] input_value[ None ]\n"
-                    "  TypeError: int() argument must be a string, a bytes-like object or a real number, not 'NoneType'"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ <class 'int'> ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
+            "  ValueError: invalid literal for int() with base 10: 'a'"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(None, int)
+        assert str(excinfo.value) == (
+            "type[ <class 'int'> ] input_type[ <class 'NoneType'> ] input_value[ None ]\n"
+            "  TypeError: int() argument must be a string, a bytes-like object or a real number, not 'NoneType'"
+        )
 
     def test_float(self):
         assert validate_value(-1, float) == -1.0
@@ -109,69 +92,45 @@ class TestValidateValue:
         assert validate_value("1.1", float) == 1.1
         assert validate_value(True, float) == 1.0
         assert validate_value(False, float) == 0.0
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'float'> ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
-                    "  ValueError: could not convert string to float: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("a", float)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'float'> ] input_type[ <class 'NoneType'> ] input_value[ None ]\n"
-                    "  TypeError: float() argument must be a string or a real number, not 'NoneType'"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ <class 'float'> ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
+            "  ValueError: could not convert string to float: 'a'"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(None, float)
+        assert str(excinfo.value) == (
+            "type[ <class 'float'> ] input_type[ <class 'NoneType'> ] input_value[ None ]\n"
+            "  TypeError: float() argument must be a string or a real number, not 'NoneType'"
+        )
 
     def test_str(self):
         assert validate_value("a", str) == "a"
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'str'> ] input_type[ <class 'NoneType'> ] input_value[ None ]\n"
-                    "  ValueError: value is not a valid <class 'str'>"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(None, str)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'str'> ] input_type[ <class 'int'> ] input_value[ 0 ]\n"
-                    "  ValueError: value is not a valid <class 'str'>"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ <class 'str'> ] input_type[ <class 'NoneType'> ] input_value[ None ]\n"
+            "  ValueError: value is not a valid <class 'str'>"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(0, str)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'str'> ] input_type[ <class 'bool'> ] input_value[ True ]\n"
-                    "  ValueError: value is not a valid <class 'str'>"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ <class 'str'> ] input_type[ <class 'int'> ] input_value[ 0 ]\n"
+            "  ValueError: value is not a valid <class 'str'>"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(True, str)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'str'> ] input_type[ <class 'bool'> ] input_value[ False ]\n"
-                    "  ValueError: value is not a valid <class 'str'>"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ <class 'str'> ] input_type[ <class 'bool'> ] input_value[ True ]\n"
+            "  ValueError: value is not a valid <class 'str'>"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(False, str)
+        assert str(excinfo.value) == (
+            "type[ <class 'str'> ] input_type[ <class 'bool'> ] input_value[ False ]\n"
+            "  ValueError: value is not a valid <class 'str'>"
+        )
 
     def test_bytes(self):
         assert validate_value(b"b", bytes) == b"b"
@@ -180,30 +139,22 @@ class TestValidateValue:
         assert validate_value(1, bytes) == b"\x00"
         assert validate_value(False, bytes) == b""
         assert validate_value(True, bytes) == b"\x00"
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'bytes'> ] input_type[ <class 'float'> ] input_value[ 1.1 ]\n"
-                    "  TypeError: cannot convert 'float' object to bytes"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(1.1, bytes)
+        assert str(excinfo.value) == (
+            "type[ <class 'bytes'> ] input_type[ <class 'float'> ] input_value[ 1.1 ]\n"
+            "  TypeError: cannot convert 'float' object to bytes"
+        )
 
     def test_date(self):
         assert validate_value("2023-01-01", date) == date(2023, 1, 1)
         assert validate_value(date(2023, 1, 1), date) == date(2023, 1, 1)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'datetime.date'> ] input_type[ <class 'str'> ] input_value[ '2023' ]\n"
-                    "  ValueError: Invalid isoformat string: '2023'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("2023", date)
+        assert str(excinfo.value) == (
+            "type[ <class 'datetime.date'> ] input_type[ <class 'str'> ] input_value[ '2023' ]\n"
+            "  ValueError: Invalid isoformat string: '2023'"
+        )
 
     def test_datetime(self):
         assert validate_value(
@@ -214,46 +165,52 @@ class TestValidateValue:
             datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
             datetime,
         ) == datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc)
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'datetime.datetime'> ] input_type[ <class 'str'> ] input_value[ '2023' ]\n"
-                    "  ValueError: Invalid isoformat string: '2023'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("2023", datetime)
+        assert str(excinfo.value) == (
+            "type[ <class 'datetime.datetime'> ] input_type[ <class 'str'> ] input_value[ '2023' ]\n"
+            "  ValueError: Invalid isoformat string: '2023'"
+        )
 
     def test_literal(self):
         validate_value("A", Literal["A", "B"])
         validate_value("B", Literal["A", "B"])
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Literal['A', 'B'] ] input_type[ <class 'str'> ] input_value[ 'C' ]\n"
-                    "  ValueError: value is not a one of ['A', 'B']"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("C", Literal["A", "B"])
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                "type[ Literal['1'] ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
-                "  ValueError: value is not a one of ['1']"
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ Literal['A', 'B'] ] input_type[ <class 'str'> ] input_value[ 'C' ]\n"
+            "  ValueError: value is not a one of ['A', 'B']"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(1, Literal["1"])
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                "type[ Literal[1] ] input_type[ <class 'str'> ] input_value[ '1' ]\n"
-                "  ValueError: value is not a one of [1]"
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ Literal['1'] ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
+            "  ValueError: value is not a one of ['1']"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             validate_value("1", Literal[1])
+        assert str(excinfo.value) == (
+            "type[ Literal[1] ] input_type[ <class 'str'> ] input_value[ '1' ]\n"
+            "  ValueError: value is not a one of [1]"
+        )
+        assert validate_value(True, Literal[1, True]) is True
+        assert validate_value(1, Literal[1, True]) == 1
+        with pytest.raises(ValidationError) as excinfo:
+            validate_value(1, Literal[True])
+        assert str(excinfo.value) == (
+            "type[ Literal[True] ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
+            "  ValueError: value is not a one of [True]"
+        )
+        with pytest.raises(ValidationError):
+            validate_value([], Literal["A"])
+        with pytest.raises(ValidationError):
+            validate_value(1.0, Literal[True])
+
+        class StrE(str, Enum):
+            A = "a"
+
+        assert validate_value(StrE.A, Literal["a"]) is StrE.A
+        assert validate_value("a", Literal[StrE.A]) == "a"
 
     def test_enum(self):
         class E(str, Enum):
@@ -261,252 +218,238 @@ class TestValidateValue:
 
         assert isinstance(validate_value("a", E), E)
         assert validate_value("a", E) == E.A
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <enum 'E'> ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
-                    "  ValueError: 1 is not a valid TestValidateValue.test_enum.<locals>.E"
-                )
-            ),
-        ):
+        assert validate_value(E.A, E) is E.A
+
+        class IntE(int, Enum):
+            ONE = 1
+
+        assert validate_value(1, IntE) is IntE.ONE
+        assert validate_value(True, IntE) is IntE.ONE
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(1, E)
+        assert str(excinfo.value) == (
+            "type[ <enum 'E'> ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
+            "  ValueError: 1 is not a valid TestValidateValue.test_enum.<locals>.E"
+        )
+
+        class MissingE(Enum):
+            A = "a"
 
-    def test_list(self):
-        for T in (list, List):
-            assert validate_value([], T) == []
-            assert validate_value((), T) == []
-            assert validate_value([], T[int]) == []
-            assert validate_value((), T[int]) == []
-            assert validate_value([0, 1], T) == [0, 1]
-            assert validate_value((0, 1), T) == [0, 1]
-            assert validate_value([0, 1], T[int]) == [0, 1]
-            assert validate_value((0, 1), T[int]) == [0, 1]
-            assert validate_value(["0", "1"], T[str]) == ["0", "1"]
-            assert validate_value(("0", "1"), T[str]) == ["0", "1"]
-            assert validate_value([0, "1"], T[int]) == [0, 1]
-            assert validate_value((0, "1"), T[int]) == [0, 1]
-            assert validate_value([[0], (1,)], T[T[int]]) == [[0], [1]]
-            assert validate_value(([0], (1,)), T[T[int]]) == [[0], [1]]
-            assert validate_value([[0], ("1",)], T[T[int]]) == [[0], [1]]
-            assert validate_value(([0], ("1",)), T[T[int]]) == [[0], [1]]
-            assert validate_value([["0"], ("y",)], T[T[bool]]) == [[False], [True]]
-            assert validate_value((["0"], ("y",)), T[T[bool]]) == [[False], [True]]
-
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ list[int] ] input_type[ <class 'list'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "  ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+            @classmethod
+            def _missing_(cls, value):
+                return cls.A
+
+        assert validate_value("b", MissingE) is MissingE.A
+
+    @pytest.mark.parametrize("T", [list, List])
+    def test_list(self, T):
+        assert validate_value([], T) == []
+        assert validate_value((), T) == []
+        assert validate_value([], T[int]) == []
+        assert validate_value((), T[int]) == []
+        assert validate_value([0, 1], T) == [0, 1]
+        assert validate_value((0, 1), T) == [0, 1]
+        assert validate_value([0, 1], T[int]) == [0, 1]
+        assert validate_value((0, 1), T[int]) == [0, 1]
+        value = [0, 1]
+        assert validate_value(value, T[int]) is not value
+        assert validate_value((0.0, 1.0), T[float]) == [0.0, 1.0]
+        assert validate_value(["0", "1"], T[str]) == ["0", "1"]
+        assert validate_value(("0", "1"), T[str]) == ["0", "1"]
+        assert validate_value([b"0", "1"], T[bytes]) == [b"0", b"1"]
+        assert validate_value((b"0", "1"), T[bytes]) == [b"0", b"1"]
+        assert validate_value([0, "1"], T[int]) == [0, 1]
+        assert validate_value((0, "1"), T[int]) == [0, 1]
+        assert validate_value([[0], (1,)], T[T[int]]) == [[0], [1]]
+        assert validate_value(([0], (1,)), T[T[int]]) == [[0], [1]]
+        assert validate_value([[0], ("1",)], T[T[int]]) == [[0], [1]]
+        assert validate_value(([0], ("1",)), T[T[int]]) == [[0], [1]]
+        assert validate_value([["0"], ("y",)], T[T[bool]]) == [[False], [True]]
+        assert validate_value((["0"], ("y",)), T[T[bool]]) == [[False], [True]]
+
+    def test_list_errors(self):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value([0, "a"], list[int])
+        assert str(excinfo.value) == (
+            "type[ list[int] ] input_type[ <class 'list'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "  ValueError: invalid literal for int() with base 10: 'a'"
+        )
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ List[int] ] input_type[ <class 'list'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "  ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value([0, "a"], List[int])
+        assert str(excinfo.value) == (
+            "type[ List[int] ] input_type[ <class 'list'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "  ValueError: invalid literal for int() with base 10: 'a'"
+        )
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ list[int] ] input_type[ <class 'tuple'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "  ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value((0, "a"), list[int])
+        assert str(excinfo.value) == (
+            "type[ list[int] ] input_type[ <class 'tuple'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "  ValueError: invalid literal for int() with base 10: 'a'"
+        )
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ List[int] ] input_type[ <class 'tuple'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "  ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value((0, "a"), List[int])
-
-    def test_tuple(self):
-        for T in (tuple, Tuple):
-            assert validate_value((), T) == ()
-            assert validate_value([], T) == ()
-            assert validate_value((), T[int]) == ()
-            assert validate_value([], T[int]) == ()
-            assert validate_value((0, 1), T) == (0, 1)
-            assert validate_value([0, 1], T) == (0, 1)
-            assert validate_value((0, 1), T[int, int]) == (0, 1)
-            assert validate_value([0, 1], T[int, int]) == (0, 1)
-            assert validate_value((0, "1"), T[int, str]) == (0, "1")
-            assert validate_value([0, "1"], T[int, str]) == (0, "1")
-            assert validate_value((0, "1"), T[int, ...]) == (0, 1)
-            assert validate_value([0, "1"], T[int, ...]) == (0, 1)
-            assert validate_value((0, 1, "2"), T[int, ...]) == (0, 1, 2)
-            assert validate_value([0, 1, "2"], T[int, ...]) == (0, 1, 2)
-            assert validate_value(([0], [1]), T[list[int], list[int]]) == ([0], [1])
-            assert validate_value([[0], [1]], T[list[int], list[int]]) == ([0], [1])
-            assert validate_value(([0], ["1"]), T[list[int], list[int]]) == ([0], [1])
-            assert validate_value([[0], ["1"]], T[list[int], list[int]]) == ([0], [1])
-            assert validate_value((["0"], ["y"]), T[list[bool], tuple[bool]]) == ([False], (True,))
-            assert validate_value([["0"], ["y"]], T[list[bool], tuple[bool]]) == ([False], (True,))
-            assert validate_value(tuple(range(100)), T[int, ...]) == tuple(range(100))
-            assert validate_value(list(range(100)), T[int, ...]) == tuple(range(100))
-
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ tuple[int, int] ] input_type[ <class 'tuple'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "  ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ List[int] ] input_type[ <class 'tuple'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "  ValueError: invalid literal for int() with base 10: 'a'"
+        )
+
+    @pytest.mark.parametrize("T", [tuple, Tuple])
+    def test_tuple(self, T):
+        assert validate_value((), T) == ()
+        assert validate_value([], T) == ()
+        assert validate_value((), T[int]) == ()
+        assert validate_value([], T[int]) == ()
+        assert validate_value((0, 1), T) == (0, 1)
+        assert validate_value([0, 1], T) == (0, 1)
+        assert validate_value((0, 1), T[int, int]) == (0, 1)
+        assert validate_value([0, 1], T[int, int]) == (0, 1)
+        assert validate_value((0, "1"), T[int, str]) == (0, "1")
+        assert validate_value([0, "1"], T[int, str]) == (0, "1")
+        assert validate_value((0, "1"), T[int, ...]) == (0, 1)
+        assert validate_value([0, "1"], T[int, ...]) == (0, 1)
+        assert validate_value((0, 1, "2"), T[int, ...]) == (0, 1, 2)
+        assert validate_value([0, 1, "2"], T[int, ...]) == (0, 1, 2)
+        assert validate_value(([0], [1]), T[list[int], list[int]]) == ([0], [1])
+        assert validate_value([[0], [1]], T[list[int], list[int]]) == ([0], [1])
+        assert validate_value(([0], ["1"]), T[list[int], list[int]]) == ([0], [1])
+        assert validate_value([[0], ["1"]], T[list[int], list[int]]) == ([0], [1])
+        assert validate_value((["0"], ["y"]), T[list[bool], tuple[bool]]) == ([False], (True,))
+        assert validate_value([["0"], ["y"]], T[list[bool], tuple[bool]]) == ([False], (True,))
+        assert validate_value(tuple(range(100)), T[int, ...]) == tuple(range(100))
+        assert validate_value(list(range(100)), T[int, ...]) == tuple(range(100))
+
+    def test_tuple_errors(self):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value((0, "a"), tuple[int, int])
+        assert str(excinfo.value) == (
+            "type[ tuple[int, int] ] input_type[ <class 'tuple'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "  ValueError: invalid literal for int() with base 10: 'a'"
+        )
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Tuple[int, int] ] input_type[ <class 'tuple'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "  ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value((0, "a"), Tuple[int, int])
+        assert str(excinfo.value) == (
+            "type[ Tuple[int, int] ] input_type[ <class 'tuple'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "  ValueError: invalid literal for int() with base 10: 'a'"
+        )
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ tuple[int, int] ] input_type[ <class 'list'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "  ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value([0, "a"], tuple[int, int])
+        assert str(excinfo.value) == (
+            "type[ tuple[int, int] ] input_type[ <class 'list'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "  ValueError: invalid literal for int() with base 10: 'a'"
+        )
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Tuple[int, int] ] input_type[ <class 'list'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "  ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value([0, "a"], Tuple[int, int])
+        assert str(excinfo.value) == (
+            "type[ Tuple[int, int] ] input_type[ <class 'list'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "  ValueError: invalid literal for int() with base 10: 'a'"
+        )
+
+        with pytest.raises(ValidationError) as excinfo:
+            validate_value((0, "a"), tuple[Annotated[int, Ge(1)], str])
+        assert str(excinfo.value) == (
+            "type[ tuple[Annotated[int, Ge(value=1)], str] ] input_type[ <class 'tuple'> ] path[ 0 ] path_value[ 0 ] path_value_type[ <class 'int'> ]\n"
+            "  ValueError: value should be >= 1"
+        )
 
-    def test_set(self):
-        for T in (set, Set):
-            assert validate_value(set(), T) == set()
-            assert validate_value([], T) == set()
-            assert validate_value(set(), T[int]) == set()
-            assert validate_value([], T[int]) == set()
-            assert validate_value({0, 1}, T) == {0, 1}
-            assert validate_value([0, 1], T) == {0, 1}
-            assert validate_value({0, 1}, T[int]) == {0, 1}
-            assert validate_value([0, 1], T[int]) == {0, 1}
-            assert validate_value({"0", "1"}, T[int]) == {0, 1}
-            assert validate_value(["0", "1"], T[int]) == {0, 1}
-            assert validate_value([{0}, {1}], T[tuple[int]]) == {(0,), (1,)}
-            assert validate_value([[0], [1]], T[tuple[int]]) == {(0,), (1,)}
-            assert validate_value([{"0"}, {"1"}], T[tuple[int]]) == {(0,), (1,)}
-            assert validate_value([["0"], ["1"]], T[tuple[int]]) == {(0,), (1,)}
-
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ set[int] ] input_type[ <class 'list'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "  ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError):
+            validate_value(("b",), tuple[Literal["a"]])
+
+    @pytest.mark.parametrize("T", [set, Set])
+    def test_set(self, T):
+        assert validate_value(set(), T) == set()
+        assert validate_value([], T) == set()
+        assert validate_value(set(), T[int]) == set()
+        assert validate_value([], T[int]) == set()
+        assert validate_value({0, 1}, T) == {0, 1}
+        assert validate_value([0, 1], T) == {0, 1}
+        assert validate_value({0, 1}, T[int]) == {0, 1}
+        assert validate_value([0, 1], T[int]) == {0, 1}
+        assert validate_value({"0", "1"}, T[int]) == {0, 1}
+        assert validate_value(["0", "1"], T[int]) == {0, 1}
+        assert validate_value([{0}, {1}], T[tuple[int]]) == {(0,), (1,)}
+        assert validate_value([[0], [1]], T[tuple[int]]) == {(0,), (1,)}
+        assert validate_value([{"0"}, {"1"}], T[tuple[int]]) == {(0,), (1,)}
+        assert validate_value([["0"], ["1"]], T[tuple[int]]) == {(0,), (1,)}
+
+    def test_set_errors(self):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value([0, "a"], set[int])
+        assert str(excinfo.value) == (
+            "type[ set[int] ] input_type[ <class 'list'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "  ValueError: invalid literal for int() with base 10: 'a'"
+        )
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Set[int] ] input_type[ <class 'list'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
-                    "  ValueError: invalid literal for int() with base 10: 'a'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value([0, "a"], Set[int])
-
-    def test_mapping(self):
-        for T in (dict, Dict, Mapping):
-            assert validate_value({}, T) == {}
-            assert validate_value({"k": "v"}, T) == {"k": "v"}
-            assert validate_value({"k": "v"}, T[str, str]) == {"k": "v"}
-            assert validate_value({"0": "1"}, T[int, int]) == {0: 1}
-            assert validate_value({}, T) == {}
-            assert validate_value({"k": "v"}, T) == {"k": "v"}
-            assert validate_value({"k": "v"}, T[str, str]) == {"k": "v"}
-            assert validate_value({"0": "1"}, T[int, int]) == {0: 1}
-
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ dict[str, dict[str, int]] ] input_type[ <class 'dict'> ] path[ 'k', 'kk' ]\n"
-                    "  type[ dict[str, int] ] input_type[ <class 'dict'> ] path[ 'kk' ] path_value[ 'v' ] path_value_type[ <class 'str'> ]\n"
-                    "    ValueError: invalid literal for int() with base 10: 'v'"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ Set[int] ] input_type[ <class 'list'> ] path[ 1 ] path_value[ 'a' ] path_value_type[ <class 'str'> ]\n"
+            "  ValueError: invalid literal for int() with base 10: 'a'"
+        )
+
+    @pytest.mark.parametrize("T", [dict, Dict, Mapping])
+    def test_mapping(self, T):
+        assert validate_value({}, T) == {}
+        assert validate_value({"k": "v"}, T) == {"k": "v"}
+        assert validate_value({"k": "v"}, T[str, str]) == {"k": "v"}
+        assert validate_value({"0": "1"}, T[int, int]) == {0: 1}
+        assert validate_value({}, T) == {}
+        assert validate_value({"k": "v"}, T) == {"k": "v"}
+        assert validate_value({"k": "v"}, T[str, str]) == {"k": "v"}
+        assert validate_value({"0": "1"}, T[int, int]) == {0: 1}
+        value = {"k": 1}
+        assert validate_value(value, T[str, int]) == value
+        assert validate_value(value, T[str, int]) is not value
+        assert validate_value({"k": True}, T[str, int]) == {"k": 1}
+
+    def test_mapping_errors(self):
+        with pytest.raises(ValidationError) as excinfo:
             assert validate_value({"k": {"kk": "v"}}, dict[str, dict[str, int]])
+        assert str(excinfo.value) == (
+            "type[ dict[str, dict[str, int]] ] input_type[ <class 'dict'> ] path[ 'k', 'kk' ]\n"
+            "  type[ dict[str, int] ] input_type[ <class 'dict'> ] path[ 'kk' ] path_value[ 'v' ] path_value_type[ <class 'str'> ]\n"
+            "    ValueError: invalid literal for int() with base 10: 'v'"
+        )
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Dict[str, dict[str, int]] ] input_type[ <class 'dict'> ] path[ 'k', 'kk' ]\n"
-                    "  type[ dict[str, int] ] input_type[ <class 'dict'> ] path[ 'kk' ] path_value[ 'v' ] path_value_type[ <class 'str'> ]\n"
-                    "    ValueError: invalid literal for int() with base 10: 'v'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             assert validate_value({"k": {"kk": "v"}}, Dict[str, dict[str, int]])
+        assert str(excinfo.value) == (
+            "type[ Dict[str, dict[str, int]] ] input_type[ <class 'dict'> ] path[ 'k', 'kk' ]\n"
+            "  type[ dict[str, int] ] input_type[ <class 'dict'> ] path[ 'kk' ] path_value[ 'v' ] path_value_type[ <class 'str'> ]\n"
+            "    ValueError: invalid literal for int() with base 10: 'v'"
+        )
 
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ collections.abc.Mapping[str, dict[str, int]] ] input_type[ <class 'dict'> ] path[ 'k', 'kk' ]\n"
-                    "  type[ dict[str, int] ] input_type[ <class 'dict'> ] path[ 'kk' ] path_value[ 'v' ] path_value_type[ <class 'str'> ]\n"
-                    "    ValueError: invalid literal for int() with base 10: 'v'"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             assert validate_value({"k": {"kk": "v"}}, Mapping[str, dict[str, int]])
+        assert str(excinfo.value) == (
+            "type[ collections.abc.Mapping[str, dict[str, int]] ] input_type[ <class 'dict'> ] path[ 'k', 'kk' ]\n"
+            "  type[ dict[str, int] ] input_type[ <class 'dict'> ] path[ 'kk' ] path_value[ 'v' ] path_value_type[ <class 'str'> ]\n"
+            "    ValueError: invalid literal for int() with base 10: 'v'"
+        )
+
+        with pytest.raises(ValidationError) as excinfo:
+            assert validate_value({"k": 0}, dict[str, Annotated[int, Ge(1)]])
+        assert str(excinfo.value) == (
+            "type[ dict[str, Annotated[int, Ge(value=1)]] ] input_type[ <class 'dict'> ] path[ 'k' ] path_value[ 0 ] path_value_type[ <class 'int'> ]\n"
+            "  ValueError: value should be >= 1"
+        )
 
     def test_abcmeta(self):
         assert validate_value([1], Iterable) == [1]
         assert validate_value([1], Iterable[int]) == [1]
         assert validate_value([1], Sequence) == [1]
         assert validate_value([1], Sequence[int]) == [1]
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ <class 'collections.abc.Iterable'> ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
-                    "  ValueError: value is not a valid <class 'collections.abc.Iterable'>"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(1, Iterable)
+        assert str(excinfo.value) == (
+            "type[ <class 'collections.abc.Iterable'> ] input_type[ <class 'int'> ] input_value[ 1 ]\n"
+            "  ValueError: value is not a valid <class 'collections.abc.Iterable'>"
+        )
 
     def test_type(self):
         class A:
@@ -520,17 +463,12 @@ class TestValidateValue:
 
         assert validate_value(A, Type[A]) == A
         assert validate_value(B, Type[A]) == B
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Type[test_validate.TestValidateValue.test_type.<locals>.A] ] input_type[ <class 'type'> ]"
-                    " input_value[ <class 'test_validate.TestValidateValue.test_type.<locals>.C'> ]\n"
-                    "  ValueError: invalid value for Type[test_validate.TestValidateValue.test_type.<locals>.A]"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             validate_value(C, Type[A])
+        assert str(excinfo.value) == (
+            "type[ Type[test_validate.TestValidateValue.test_type.<locals>.A] ] input_type[ <class 'type'> ] input_value[ <class 'test_validate.TestValidateValue.test_type.<locals>.C'> ]\n"
+            "  ValueError: invalid value for Type[test_validate.TestValidateValue.test_type.<locals>.A]"
+        )
 
     def test_union(self):
         assert validate_value(1, int | str) == 1
@@ -541,68 +479,59 @@ class TestValidateValue:
         assert validate_value("1", Union[str, float]) == "1"
         assert validate_value(1, float | str) == 1.0
         assert validate_value(1, Union[float | str]) == 1.0
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ int | float ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
-                    "  type[ <class 'int'> ] input_type[ <class 'str'> ]\n"
-                    "    ValueError: invalid literal for int() with base 10: 'a'\n"
-                    "  type[ <class 'float'> ] input_type[ <class 'str'> ]\n"
-                    "    ValueError: could not convert string to float: 'a'"
-                )
-            ),
-        ):
+        # equal unions with different member order are validated in their own order
+        assert type(validate_value("1", int | float)) is int
+        assert type(validate_value("1", float | int)) is float
+        assert type(validate_value("1", Union[int, float])) is int
+        assert type(validate_value("1", Union[float, int])) is float
+        assert type(validate_value("1", Annotated[int | float, Ge(0)])) is int
+        assert type(validate_value("1", Annotated[float | int, Ge(0)])) is float
+        with pytest.raises(ValidationError) as excinfo:
             assert validate_value("a", int | float) == "a"
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Union[int, float] ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
-                    "  type[ <class 'int'> ] input_type[ <class 'str'> ]\n"
-                    "    ValueError: invalid literal for int() with base 10: 'a'\n"
-                    "  type[ <class 'float'> ] input_type[ <class 'str'> ]\n"
-                    "    ValueError: could not convert string to float: 'a'"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ int | float ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
+            "  type[ <class 'int'> ] input_type[ <class 'str'> ]\n"
+            "    ValueError: invalid literal for int() with base 10: 'a'\n"
+            "  type[ <class 'float'> ] input_type[ <class 'str'> ]\n"
+            "    ValueError: could not convert string to float: 'a'"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             assert validate_value("a", Union[int, float]) == "a"
+        assert str(excinfo.value) == (
+            "type[ Union[int, float] ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
+            "  type[ <class 'int'> ] input_type[ <class 'str'> ]\n"
+            "    ValueError: invalid literal for int() with base 10: 'a'\n"
+            "  type[ <class 'float'> ] input_type[ <class 'str'> ]\n"
+            "    ValueError: could not convert string to float: 'a'"
+        )
 
         T = Annotated[int | float, Ge(1)]
         assert validate_value("a", T | str) == "a"
         assert validate_value("a", Union[T, str]) == "a"
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Union[Annotated[int | float, Ge(value=1)], bool] ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
-                    "  type[ int | float ] input_type[ <class 'str'> ]\n"
-                    "    type[ <class 'int'> ] input_type[ <class 'str'> ]\n"
-                    "      ValueError: invalid literal for int() with base 10: 'a'\n"
-                    "    type[ <class 'float'> ] input_type[ <class 'str'> ]\n"
-                    "      ValueError: could not convert string to float: 'a'\n"
-                    "  type[ <class 'bool'> ] input_type[ <class 'str'> ]\n"
-                    "    ValueError: could not convert value to bool"
-                )
-            ),
-        ):
+        with pytest.raises(ValidationError) as excinfo:
             assert validate_value("a", T | bool) == "a"
-        with pytest.raises(
-            ValidationError,
-            match=re.escape(
-                (
-                    "type[ Union[Annotated[int | float, Ge(value=1)], bool] ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
-                    "  type[ int | float ] input_type[ <class 'str'> ]\n"
-                    "    type[ <class 'int'> ] input_type[ <class 'str'> ]\n"
-                    "      ValueError: invalid literal for int() with base 10: 'a'\n"
-                    "    type[ <class 'float'> ] input_type[ <class 'str'> ]\n"
-                    "      ValueError: could not convert string to float: 'a'\n"
-                    "  type[ <class 'bool'> ] input_type[ <class 'str'> ]\n"
-                    "    ValueError: could not convert value to bool"
-                )
-            ),
-        ):
+        assert str(excinfo.value) == (
+            "type[ Union[Annotated[int | float, Ge(value=1)], bool] ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
+            "  type[ int | float ] input_type[ <class 'str'> ]\n"
+            "    type[ <class 'int'> ] input_type[ <class 'str'> ]\n"
+            "      ValueError: invalid literal for int() with base 10: 'a'\n"
+            "    type[ <class 'float'> ] input_type[ <class 'str'> ]\n"
+            "      ValueError: could not convert string to float: 'a'\n"
+            "  type[ <class 'bool'> ] input_type[ <class 'str'> ]\n"
+            "    ValueError: could not convert value to bool"
+        )
+        with pytest.raises(ValidationError) as excinfo:
             assert validate_value("a", Union[T, bool]) == "a"
+        assert str(excinfo.value) == (
+            "type[ Union[Annotated[int | float, Ge(value=1)], bool] ] input_type[ <class 'str'> ] input_value[ 'a' ]\n"
+            "  type[ int | float ] input_type[ <class 'str'> ]\n"
+            "    type[ <class 'int'> ] input_type[ <class 'str'> ]\n"
+            "      ValueError: invalid literal for int() with base 10: 'a'\n"
+            "    type[ <class 'float'> ] input_type[ <class 'str'> ]\n"
+            "      ValueError: could not convert string to float: 'a'\n"
+            "  type[ <class 'bool'> ] input_type[ <class 'str'> ]\n"
+            "    ValueError: could not convert value to bool"
+        )
 
         assert validate_value(1, int | Any) == 1
         assert validate_value(1, Union[int, Any]) == 1
@@ -613,6 +542,22 @@ class TestValidateValue:
         assert validate_value("1", T) == "1"
         T = Annotated[str, None] | int
         assert validate_value(1, T) == 1
+        T = Annotated[float, Ge(0)] | Annotated[int, Ge(0)]
+        assert type(validate_value(1, T)) is float
+        assert type(validate_value("1", T)) is float
+        with pytest.raises(ValidationError) as excinfo:
+            validate_value(-1, T)
+        assert str(excinfo.value) == (
+            "type[ Union[Annotated[float, Ge(value=0)], Annotated[int, Ge(value=0)]] ] input_type[ <class 'int'> ] input_value[ -1 ]\n"
+            "  type[ Annotated[float, Ge(value=0)] ] input_type[ <class 'int'> ]\n"
+            "    ValueError: value should be >= 0\n"
+            "  type[ Annotated[int, Ge(value=0)] ] input_type[ <class 'int'> ]\n"
+            "    ValueError: value should be >= 0"
+        )
+
+        # members are tried in order, an Annotated member does not jump ahead for its exact origin type
+        assert validate_value("5", Union[int, Annotated[str, MinLen(1)]]) == 5
+        assert type(validate_value(1, Union[float, Annotated[int, Ge(0)]])) is float
 
         assert validate_value([1], list[int] | list[str]) == [1]
         assert validate_value(["a"], list[int] | list[str]) == ["a"]
@@ -625,3 +570,50 @@ class TestValidateValue:
         assert validate_value(["1"], TT[int]) == [1]
         with pytest.raises(ValidationError):
             assert validate_value(["a"], TT[int])
+
+    def test_register_validator(self):
+        class A:
+            def __init__(self, value):
+                self.value = value
+
+        assert validate_value(1, A).value == 1
+
+        register_validator(A, lambda value, T: T(value * 2))
+
+        assert validate_value(1, A).value == 2
+        assert validate_value([1], list[A])[0].value == 2
+
+        with pytest.raises(Exception, match="already registered"):
+            register_validator(A, lambda value, T: T(value))
+
+        validate_bytes = get_validator(bytes)
+        register_validator(bytes, lambda value, T: value.upper(), force=True)
+        try:
+            assert validate_value(b"a", bytes) == b"A"
+            assert validate_value(b"a", Annotated[bytes, None]) == b"A"
+            assert not is_pass_through_type(bytes)
+        finally:
+            register_validator(bytes, validate_bytes, force=True)
+        assert is_pass_through_type(bytes)
+        assert validate_value(b"a", bytes) == b"a"
+        assert validate_value(b"a", Annotated[bytes, None]) == b"a"
+
+    def test_register_scalar_validator(self):
+        validate_int = get_validator(int)
+
+        def validate_positive_int(value, T, /):
+            value = validate_int(value, T)
+            if value < 0:
+                raise ValueError("negative")
+            return value
+
+        register_validator(int, validate_positive_int, force=True)
+        try:
+            with pytest.raises(ValidationError):
+                validate_value(-1, int)
+            with pytest.raises(ValidationError):
+                validate_value((-1, "a"), tuple[int, str])
+            assert validate_value((1, "a"), tuple[int, str]) == (1, "a")
+        finally:
+            register_validator(int, validate_int, force=True)
+        assert validate_value((-1, "a"), tuple[int, str]) == (-1, "a")